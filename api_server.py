@@ -1,101 +1,223 @@
+import gzip
+import hashlib
+import json
 import os
-from flask import Flask, jsonify, request
+import threading
+from functools import wraps
+
+from cachetools import TTLCache
+from flask import Flask, Response, request
+
+# Conditional orjson import: Rust-backed serializer, several times faster
+# than stdlib json on the list-of-dicts payloads this API returns
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Conditional brotli import: clients that accept br get ~20% smaller bodies
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+    brotli = None
+
 from flask_cors import CORS
 from database import DatabaseManager
+from ranking_system import RankingSystem
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
 
-# Initialize database manager
+# Initialize database manager and ranking system once at boot, not per request
 db = DatabaseManager()
+# Rankings are recalculated by the scrape process, not this one, so the
+# ranking system's memos must age out on their own; 60s matches the
+# route-level response cache
+rs = RankingSystem(db, memo_ttl=60)
+
+# Version counter for cache invalidation: bumping it makes every cached
+# response key stale at once. Write paths should call invalidate_cache().
+_cache_version = 0
+_cache_lock = threading.Lock()
+
+
+def _serialize(obj) -> bytes:
+    """Serialize to compact JSON bytes with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(',', ':'), default=str).encode('utf-8')
+
+
+def ojsonify(obj, status=200) -> Response:
+    """jsonify replacement that serializes through _serialize"""
+    return Response(_serialize(obj), status=status, mimetype='application/json')
+
+
+def invalidate_cache():
+    """Invalidate all cached GET responses (call after any write)"""
+    global _cache_version
+    with _cache_lock:
+        _cache_version += 1
+
+
+def cached_json(ttl=60):
+    """Cache a GET handler's serialized JSON response with an ETag.
+
+    The wrapped handler returns plain data (dict/list) on success; this
+    decorator serializes it once, stores the bytes (plus gzip/brotli
+    variants, compressed once) and a sha1 ETag in a TTL cache keyed on
+    path + query string, and answers If-None-Match requests with an
+    empty 304. Error responses (tuples/Response objects) pass through
+    uncached.
+    """
+    cache = TTLCache(maxsize=512, ttl=ttl)
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (_cache_version, request.path, request.query_string)
+            with _cache_lock:
+                entry = cache.get(key)
+
+            if entry is None:
+                result = func(*args, **kwargs)
+                if isinstance(result, (Response, tuple)):
+                    # Errors and custom responses are never cached
+                    return result
+                body = _serialize(result)
+                etag = hashlib.sha1(body).hexdigest()
+                bodies = {None: body, 'gzip': gzip.compress(body, 6)}
+                if BROTLI_AVAILABLE:
+                    bodies['br'] = brotli.compress(body, quality=5)
+                entry = (bodies, etag)
+                with _cache_lock:
+                    cache[key] = entry
+
+            bodies, etag = entry
+            if request.headers.get('If-None-Match') == etag:
+                return Response(status=304, headers={'ETag': etag})
+
+            accepted = request.headers.get('Accept-Encoding', '')
+            encoding = None
+            if 'br' in accepted and 'br' in bodies:
+                encoding = 'br'
+            elif 'gzip' in accepted:
+                encoding = 'gzip'
+
+            headers = {'ETag': etag,
+                       'Cache-Control': f'public, max-age={ttl}',
+                       'Vary': 'Accept-Encoding'}
+            if encoding:
+                headers['Content-Encoding'] = encoding
+            return Response(bodies[encoding], mimetype='application/json',
+                            headers=headers, direct_passthrough=True)
+        return wrapper
+    return decorator
+
 
 @app.route('/health', methods=['GET'])
 def health_check():
-    return jsonify({
-        "status": "healthy", 
+    return ojsonify({
+        "status": "healthy",
         "database": "connected" if db.is_postgres else "sqlite",
         "supports_categories": True
-    }), 200
+    })
 
 @app.route('/api/categories', methods=['GET'])
+@cached_json(ttl=60)
 def get_categories():
     """Get all available categories"""
     try:
-        categories = db.get_categories()
-        return jsonify(categories)
+        return db.get_categories()
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return ojsonify({"error": str(e)}, status=500)
 
 @app.route('/api/categories/<slug>', methods=['GET'])
+@cached_json(ttl=60)
 def get_category(slug):
     """Get a specific category by slug"""
     try:
         category = db.get_category_by_slug(slug)
         if not category:
-            return jsonify({"error": "Category not found"}), 404
-        return jsonify(category)
+            return ojsonify({"error": "Category not found"}, status=404)
+        return category
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return ojsonify({"error": str(e)}, status=500)
 
 @app.route('/api/services', methods=['GET'])
+@cached_json(ttl=60)
 def get_services():
     try:
         name = request.args.get('name')
         category = request.args.get('category')
-        
+
         if name:
             service = db.get_service_with_features(name)
             if not service:
-                return jsonify({"error": "Service not found"}), 404
-            return jsonify(service)
-        
+                return ojsonify({"error": "Service not found"}, status=404)
+            return service
+
         # Support filtering by category slug
-        services = db.get_all_services(category_slug=category)
-        return jsonify(services)
+        return db.get_all_services(category_slug=category)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return ojsonify({"error": str(e)}, status=500)
 
 @app.route('/api/rankings/<context>', methods=['GET'])
+@cached_json(ttl=60)
 def get_rankings(context):
     try:
-        rankings = db.get_rankings(context)
-        return jsonify(rankings)
+        return db.get_rankings(context)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return ojsonify({"error": str(e)}, status=500)
 
 @app.route('/api/compare', methods=['GET'])
+@cached_json(ttl=60)
 def get_comparison():
     try:
         category = request.args.get('category')
-        comparison = db.get_feature_comparison(category_slug=category)
-        return jsonify(comparison)
+        return db.get_feature_comparison(category_slug=category)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return ojsonify({"error": str(e)}, status=500)
+
+# Boolean requirement params accepted by /api/recommend
+_BOOL_KEYS = ('free_tier', 'collaboration', 'offline_mode', 'api_available')
+_TRUE_VALUES = frozenset(('true', '1', 'yes'))
+
+# The recommend keyspace is tiny (context x category x 3^4 requirement
+# states), so serialized results are materialized on first use and served
+# as O(1) lookups until invalidate_cache() bumps the version.
+_recommend_cache = TTLCache(maxsize=2048, ttl=300)
+
 
 @app.route('/api/recommend', methods=['GET'])
 def get_recommendations():
     try:
-        context = request.args.get('context', 'personal_use')
-        category = request.args.get('category')
-        free_tier = request.args.get('free_tier') == 'true'
-        collaboration = request.args.get('collaboration') == 'true'
-        offline_mode = request.args.get('offline_mode') == 'true'
-        api_available = request.args.get('api_available') == 'true'
-        
-        # This mirrors the logic in main.py recommendation
-        from ranking_system import RankingSystem
-        rs = RankingSystem(db)
-        
-        requirements = {}
-        if request.args.get('free_tier') is not None: requirements['free_tier'] = free_tier
-        if request.args.get('collaboration') is not None: requirements['collaboration'] = collaboration
-        if request.args.get('offline_mode') is not None: requirements['offline_mode'] = offline_mode
-        if request.args.get('api_available') is not None: requirements['api_available'] = api_available
-        
-        recommendations = rs.recommend_service(requirements, context, category_slug=category)
-        return jsonify(recommendations)
+        args = request.args
+        context = args.get('context', 'personal_use')
+        category = args.get('category')
+        # One pass over the known keys instead of two args lookups each;
+        # also accepts 1/yes/True spellings
+        requirements = {key: args[key].lower() in _TRUE_VALUES
+                        for key in _BOOL_KEYS if key in args}
+
+        # Each key encodes one of required-True/required-False/absent per bool
+        key = (_cache_version, context, category,
+               tuple(requirements.get(k) for k in _BOOL_KEYS))
+        with _cache_lock:
+            body = _recommend_cache.get(key)
+        if body is None:
+            # This mirrors the logic in main.py recommendation
+            recommendations = rs.recommend_service(requirements, context, category_slug=category)
+            body = _serialize(recommendations)
+            with _cache_lock:
+                _recommend_cache[key] = body
+        return Response(body, mimetype='application/json')
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return ojsonify({"error": str(e)}, status=500)
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
@@ -1,18 +1,143 @@
 """
 Base scraper class with common functionality for extracting features from todo list websites.
 """
+import asyncio
+import os
+import re
+import threading
 import time
 import json
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from urllib.parse import urlparse
 import requests
 from bs4 import BeautifulSoup
 
+# Conditional httpx import: shared HTTP/2 client for the sync fetch path
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+    httpx = None
 
-@dataclass
+# Conditional requests-cache import: on-disk HTTP cache so repeated runs
+# revalidate with conditional GETs instead of refetching every page
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+    requests_cache = None
+
+# Conditional aiohttp import: enables concurrent scraping via scrape_many()
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    aiohttp = None
+
+# Conditional selectolax import: its Modest C engine parses and extracts text
+# several times faster than BeautifulSoup. Set SCRAPER_PARSER=bs4 to force BS4.
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+    HTMLParser = None
+
+_USE_SELECTOLAX = SELECTOLAX_AVAILABLE and os.environ.get('SCRAPER_PARSER', '').lower() != 'bs4'
+
+# Conditional uvloop import: libuv event loop for the async scrape path
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+    uvloop = None
+
+# Conditional Aho-Corasick import: falls back to per-keyword substring scans
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+_USER_AGENT = ('Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
+               '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+
+# Seconds between requests to the same host (politeness delay)
+_FETCH_DELAY = 2.0
+
+# Read at most this much of a page: the keyword and pricing signals sit in
+# the first part of marketing pages, and the cap bounds worst-case memory
+_MAX_PAGE_BYTES = 512 * 1024
+_CHUNK_SIZE = 65536
+
+# One client shared by every scraper instance. An on-disk requests-cache
+# session takes precedence when installed: marketing pages rarely change
+# intra-day, so skipping the fetch (or answering it with a conditional
+# GET) beats the HTTP/2 handshake savings of the httpx client, which is
+# the next choice; a plain pooled requests.Session is the last resort.
+if REQUESTS_CACHE_AVAILABLE:
+    _CLIENT = requests_cache.CachedSession(
+        cache_name='scrape_cache',
+        backend='sqlite',
+        expire_after=86400,
+        cache_control=True,
+    )
+    _CLIENT.headers.update({'User-Agent': _USER_AGENT})
+elif HTTPX_AVAILABLE:
+    _CLIENT = httpx.Client(
+        http2=True,
+        headers={'User-Agent': _USER_AGENT},
+        timeout=15,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32,
+                            keepalive_expiry=60),
+    )
+else:
+    _CLIENT = requests.Session()
+    _CLIENT.headers.update({'User-Agent': _USER_AGENT})
+
+# Next-allowed-time reservation per host for the sync fetch path. Each
+# caller reserves its slot under the lock, so concurrent threads fetching
+# the same host queue up while unrelated hosts proceed with zero wait.
+_NEXT_OK: Dict[str, float] = {}
+_NEXT_OK_LOCK = threading.Lock()
+
+# Compiled once at import time; extract_pricing runs these on every page
+_PRICE_RE = re.compile(r'\$(\d+(?:\.\d+)?)\s*(?:/\s*month|per month|monthly)', re.IGNORECASE)
+_FREE_RE = re.compile(r'\b(?:free|freemium)\b', re.IGNORECASE)
+
+_PLATFORM_KEYWORDS = {
+    'ios': ['ios', 'iphone', 'ipad', 'app store'],
+    'android': ['android', 'google play', 'play store'],
+    'web': ['web', 'browser', 'website'],
+    'windows': ['windows', 'pc'],
+    'mac': ['mac', 'macos', 'mac os'],
+    'linux': ['linux']
+}
+_KEYWORD_TO_PLATFORM = {keyword: platform
+                        for platform, keywords in _PLATFORM_KEYWORDS.items()
+                        for keyword in keywords}
+# Regex alternation fallback when Aho-Corasick is unavailable: one C-level
+# scan of the page instead of a Python `in` check per keyword. Longest
+# keywords first so overlapping alternatives resolve to the longer match.
+_PLATFORM_RE = re.compile('|'.join(
+    sorted(map(re.escape, _KEYWORD_TO_PLATFORM), key=len, reverse=True)))
+
+
+@dataclass(slots=True)
 class ServiceFeatures:
-    """Data class to store extracted features"""
+    """Data class to store extracted features.
+
+    slots=True drops the per-instance __dict__, roughly halving memory
+    per record and making field access a fixed-offset load.
+    """
     name: str
     url: str
     free_tier: bool
@@ -31,76 +156,392 @@ class ServiceFeatures:
     additional_features: List[str]
 
     def to_dict(self):
-        return asdict(self)
+        # Hand-rolled instead of asdict(): skips the recursive dispatch on
+        # the hot serialize path; lists are shallow-copied to keep asdict's
+        # caller-may-mutate semantics
+        return {
+            'name': self.name,
+            'url': self.url,
+            'free_tier': self.free_tier,
+            'pricing': self.pricing,
+            'platforms': list(self.platforms),
+            'collaboration': self.collaboration,
+            'reminders': self.reminders,
+            'due_dates': self.due_dates,
+            'tags_labels': self.tags_labels,
+            'subtasks': self.subtasks,
+            'attachments': self.attachments,
+            'offline_mode': self.offline_mode,
+            'calendar_view': self.calendar_view,
+            'integrations': self.integrations,
+            'api_available': self.api_available,
+            'additional_features': list(self.additional_features),
+        }
+
+
+class FastSoup:
+    """Thin BeautifulSoup-compatible wrapper around a selectolax tree.
+
+    Exposes the small API surface the scrapers actually use (get_text and
+    CSS selection), so subclasses and the per-page caches in this module
+    work unchanged on either parser.
+    """
+
+    def __init__(self, content):
+        self._tree = HTMLParser(content)
+
+    def get_text(self, separator: str = '') -> str:
+        node = self._tree.body or self._tree.root
+        return node.text(separator=separator) if node is not None else ''
+
+    def select(self, selector: str):
+        return self._tree.css(selector)
+
+
+def _parse_html(content) -> BeautifulSoup:
+    """Parse HTML with selectolax when available, else BeautifulSoup+lxml"""
+    if _USE_SELECTOLAX:
+        return FastSoup(content)
+    return BeautifulSoup(content, 'lxml')
+
+
+# Below this size str.lower() beats the encode/decode round-trip
+_VECTOR_LOWER_MIN_CHARS = 65536
+
+# A-Z -> a-z byte table, built once; translate folds case in a single
+# C-level table pass with no Unicode property lookups
+_ASCII_LOWER_TABLE = bytes.maketrans(
+    bytes(range(ord('A'), ord('Z') + 1)),
+    bytes(range(ord('a'), ord('z') + 1)))
+
+
+def _lower(text: str) -> str:
+    """Lowercase page text, via bytes.translate for large non-ASCII pages.
+
+    Pure-ASCII strings already take a compiled fast path in str.lower(),
+    but once a page contains any multi-byte character the per-codepoint
+    Unicode walk kicks in and a table-driven C pass over the UTF-8 bytes
+    is measurably faster. Multi-byte UTF-8 sequences have the high bit
+    set so the A-Z table leaves them untouched; the keyword sets this
+    module matches are all ASCII, so results are identical where it
+    matters. Small pages just use str.lower().
+    """
+    if len(text) < _VECTOR_LOWER_MIN_CHARS or text.isascii():
+        return text.lower()
+    return text.encode('utf-8').translate(_ASCII_LOWER_TABLE).decode('utf-8')
+
+
+def _page_text_lower(soup: BeautifulSoup) -> str:
+    """Lowercased page text, extracted once and memoized on the soup.
+
+    Every feature check used to re-walk the parsed tree with get_text()
+    and make a fresh lowercase copy; this does both exactly once per page.
+    """
+    cached = getattr(soup, '_cached_lower', None)
+    if cached is None:
+        cached = _lower(soup.get_text(separator=' '))
+        soup._cached_lower = cached
+    return cached
+
+
+def _feature_terms(features: tuple) -> tuple:
+    """(feature, (lowered words + phrase)) pairs, computed once per vocabulary.
+
+    The additional-features vocabularies are module-level tuples, so the
+    lowering and word-splitting they need runs once per distinct tuple
+    instead of on every scrape. Single words sit before the full phrase:
+    they hit far more often, so the fallback's any() short-circuits
+    before scanning for the rarer compound phrase.
+    """
+    cached = _FEATURE_TERMS_CACHE.get(features)
+    if cached is None:
+        cached = _FEATURE_TERMS_CACHE[features] = tuple(
+            (feature, (*feature.lower().split(), feature.lower()))
+            for feature in features)
+    return cached
+
+
+_FEATURE_TERMS_CACHE: Dict[tuple, tuple] = {}
+
+
+class _KeywordScanner:
+    """Single-pass multi-keyword matcher shared by all scrapers.
+
+    Collects every keyword the scrapers ask about into one Aho-Corasick
+    automaton, scans each page exactly once, and answers later keyword
+    queries against the cached hit set instead of rescanning the text.
+    """
+
+    def __init__(self):
+        self._keywords = set()
+        self._automaton = None
+
+    def _register(self, keywords):
+        missing = [k for k in keywords if k not in self._keywords]
+        if missing:
+            self._keywords.update(missing)
+            self._automaton = None  # rebuilt (and pages rescanned) lazily
+
+    def _build(self):
+        automaton = ahocorasick.Automaton()
+        for keyword in self._keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        self._automaton = automaton
+
+    def found(self, soup, page_text, keywords):
+        """Return the subset of (lowercased) keywords present in page_text"""
+        keywords = [k.lower() for k in keywords]
+        self._register(keywords)
+        if self._automaton is None:
+            self._build()
+
+        cached = getattr(soup, '_keyword_hits', None)
+        if cached is None or cached[0] is not self._automaton:
+            hits = {match for _, match in self._automaton.iter(page_text)}
+            soup._keyword_hits = (self._automaton, hits)
+        else:
+            hits = cached[1]
+
+        return hits.intersection(keywords)
+
+
+_SCANNER = _KeywordScanner() if AHOCORASICK_AVAILABLE else None
+if _SCANNER is not None:
+    # Warm the matcher at import time with the known platform keywords so the
+    # first page doesn't pay the automaton construction cost; feature keywords
+    # registered later by subclasses fold in through the lazy rebuild.
+    _SCANNER._register(list(_KEYWORD_TO_PLATFORM))
+    _SCANNER._build()
+
+
+def warm_keywords(keywords):
+    """Pre-register keywords with the shared scanner and build it once.
+
+    Scraper modules call this at import with their full (deduplicated)
+    keyword universe, so the automaton is constructed a single time up
+    front instead of being rebuilt mid-crawl as each scraper's keywords
+    first appear. A no-op without pyahocorasick.
+    """
+    if _SCANNER is not None:
+        _SCANNER._register([k.lower() for k in keywords])
+        _SCANNER._build()
+
+
+class _HostThrottle:
+    """Per-host politeness gate for the async fetcher.
+
+    Different hosts are fetched fully concurrently; requests to the same
+    host are serialized and spaced _FETCH_DELAY seconds apart, so the
+    politeness sleep no longer blocks global throughput.
+    """
+
+    def __init__(self):
+        self._locks = {}
+        self._last_fetch = {}
+
+    def _lock_for(self, host):
+        lock = self._locks.get(host)
+        if lock is None:
+            lock = self._locks[host] = asyncio.Lock()
+        return lock
+
+    async def wait(self, host: str):
+        async with self._lock_for(host):
+            last = self._last_fetch.get(host)
+            if last is not None:
+                await asyncio.sleep(max(0.0, _FETCH_DELAY - (time.monotonic() - last)))
+            self._last_fetch[host] = time.monotonic()
+
+
+async def _scrape_many_async(scrapers):
+    throttle = _HostThrottle()
+    connector = aiohttp.TCPConnector(limit=32, limit_per_host=1)
+    async with aiohttp.ClientSession(headers={'User-Agent': _USER_AGENT},
+                                     connector=connector) as session:
+        return await asyncio.gather(
+            *(scraper.scrape_async(session, throttle) for scraper in scrapers),
+            return_exceptions=True
+        )
+
+
+def scrape_many(scrapers) -> list:
+    """Scrape several services concurrently with one shared HTTP session.
+
+    Network latency overlaps across hosts while per-host politeness is
+    preserved. Returns results in scraper order; a failed scrape yields
+    its exception instead of a ServiceFeatures. Requires aiohttp.
+    """
+    if not AIOHTTP_AVAILABLE:
+        raise RuntimeError("aiohttp is required for concurrent scraping "
+                           "(pip install aiohttp)")
+    if UVLOOP_AVAILABLE:
+        # libuv's compiled event loop cuts socket/timer dispatch overhead
+        return uvloop.run(_scrape_many_async(scrapers))
+    return asyncio.run(_scrape_many_async(scrapers))
 
 
 class BaseScraper(ABC):
     """Base class for all todo service scrapers"""
 
-    def __init__(self, url: str, name: str):
+    def __init__(self, url: str, name: str, session=None):
         self.url = url
         self.name = name
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
+        self._prefetched = None
+        # Shared across all scraper instances unless a caller injects its
+        # own client (e.g. for tests or custom pooling limits)
+        self.session = session if session is not None else _CLIENT
+
+    # Completed scrapes keyed by URL, shared across instances: the
+    # registry lambdas build a fresh scraper per lookup, so the memo has
+    # to live on the class to survive re-instantiation
+    _scrape_cache: Dict[str, ServiceFeatures] = {}
 
     @abstractmethod
     def scrape(self) -> ServiceFeatures:
         """Main scraping method - must be implemented by subclasses"""
         pass
 
+    def scrape_cached(self) -> ServiceFeatures:
+        """Return a memoized scrape() result for this scraper's URL.
+
+        The extracted ServiceFeatures is a pure function of the fetched
+        page, so repeated scrapes of one URL within a process reuse the
+        first result. Call scrape() directly to force a fresh fetch.
+        """
+        result = BaseScraper._scrape_cache.get(self.url)
+        if result is None:
+            result = BaseScraper._scrape_cache[self.url] = self.scrape()
+        return result
+
+    @classmethod
+    def clear_scrape_cache(cls):
+        """Drop memoized scrape results (e.g. between crawl rounds)"""
+        cls._scrape_cache.clear()
+
+    async def fetch_page_async(self, session, throttle: _HostThrottle,
+                               url: Optional[str] = None) -> BeautifulSoup:
+        """Fetch and parse a webpage through the shared async session"""
+        target_url = url or self.url
+        await throttle.wait(urlparse(target_url).netloc)
+        try:
+            buf = bytearray()
+            async with session.get(target_url,
+                                   timeout=aiohttp.ClientTimeout(total=15)) as response:
+                response.raise_for_status()
+                async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+                    buf.extend(chunk)
+                    if len(buf) >= _MAX_PAGE_BYTES:
+                        break
+            return _parse_html(bytes(buf))
+        except Exception as e:
+            print(f"Error fetching {target_url}: {e}")
+            return _parse_html("")
+
+    async def scrape_async(self, session, throttle: _HostThrottle) -> ServiceFeatures:
+        """Run scrape() against a page fetched through the async client.
+
+        The page is prefetched and handed to the next fetch_page() call,
+        so subclass scrape() implementations need no changes.
+        """
+        self._prefetched = await self.fetch_page_async(session, throttle)
+        try:
+            return self.scrape()
+        finally:
+            self._prefetched = None
+
     def fetch_page(self, url: Optional[str] = None) -> BeautifulSoup:
         """Fetch and parse a webpage"""
+        if self._prefetched is not None:
+            page = self._prefetched
+            self._prefetched = None
+            return page
         target_url = url or self.url
+        # Be respectful to servers: reserve the next slot for this host and
+        # sleep only if another fetch to the same host was too recent
+        host = urlparse(target_url).netloc
+        with _NEXT_OK_LOCK:
+            now = time.monotonic()
+            wait = max(0.0, _NEXT_OK.get(host, 0.0) - now)
+            _NEXT_OK[host] = now + wait + _FETCH_DELAY
+        if wait:
+            time.sleep(wait)
         try:
-            response = self.session.get(target_url, timeout=15)
-            response.raise_for_status()
-            time.sleep(2)  # Be respectful to servers
-            return BeautifulSoup(response.content, 'lxml')
+            buf = bytearray()
+            # Duck-type on the injected session: httpx clients stream via
+            # a .stream() method, requests-style sessions (cached or
+            # plain, where .stream is a bool default) via stream=True
+            if callable(getattr(self.session, 'stream', None)):
+                with self.session.stream('GET', target_url, timeout=15) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_bytes(_CHUNK_SIZE):
+                        buf.extend(chunk)
+                        if len(buf) >= _MAX_PAGE_BYTES:
+                            break
+            else:
+                with self.session.get(target_url, timeout=15, stream=True) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_content(_CHUNK_SIZE):
+                        buf.extend(chunk)
+                        if len(buf) >= _MAX_PAGE_BYTES:
+                            break
+            return _parse_html(bytes(buf))
         except Exception as e:
             print(f"Error fetching {target_url}: {e}")
-            return BeautifulSoup("", 'lxml')
+            return _parse_html("")
 
     def extract_platforms(self, soup: BeautifulSoup) -> List[str]:
         """Extract platform availability (web, iOS, Android, etc.)"""
-        platforms = []
-        page_text = soup.get_text().lower()
-
-        platform_keywords = {
-            'ios': ['ios', 'iphone', 'ipad', 'app store'],
-            'android': ['android', 'google play', 'play store'],
-            'web': ['web', 'browser', 'website'],
-            'windows': ['windows', 'pc'],
-            'mac': ['mac', 'macos', 'mac os'],
-            'linux': ['linux']
-        }
+        page_text = _page_text_lower(soup)
 
-        for platform, keywords in platform_keywords.items():
-            if any(keyword in page_text for keyword in keywords):
-                platforms.append(platform)
+        if _SCANNER is not None:
+            platforms = [platform for platform, keywords in _PLATFORM_KEYWORDS.items()
+                         if _SCANNER.found(soup, page_text, keywords)]
+        else:
+            found = {_KEYWORD_TO_PLATFORM[match] for match in _PLATFORM_RE.findall(page_text)}
+            platforms = [platform for platform in _PLATFORM_KEYWORDS if platform in found]
 
         return platforms if platforms else ['web']
 
+    def extract_additional_features(self, soup: BeautifulSoup, features: List[str]) -> List[str]:
+        """Return the features (original casing) mentioned on the page.
+
+        A feature counts as mentioned when its full lowercased phrase or
+        any of its words appears in the page text, matching the scrapers'
+        historical behavior. With Aho-Corasick the page is scanned once
+        for all phrases and words together; otherwise each candidate falls
+        back to substring checks against the cached lowercased text.
+        """
+        page_text = _page_text_lower(soup)
+        terms = _feature_terms(tuple(features))
+        if _SCANNER is not None:
+            all_keywords = [k for _, keywords in terms for k in keywords]
+            hits = _SCANNER.found(soup, page_text, all_keywords)
+            return [feature for feature, keywords in terms
+                    if any(k in hits for k in keywords)]
+        return [feature for feature, keywords in terms
+                if any(k in page_text for k in keywords)]
+
     def check_feature_mention(self, soup: BeautifulSoup, feature_keywords: List[str]) -> bool:
         """Check if a feature is mentioned on the page"""
-        page_text = soup.get_text().lower()
+        page_text = _page_text_lower(soup)
+        if _SCANNER is not None:
+            return bool(_SCANNER.found(soup, page_text, feature_keywords))
         return any(keyword.lower() in page_text for keyword in feature_keywords)
 
     def extract_pricing(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract pricing information"""
-        # Look for common pricing patterns
-        page_text = soup.get_text()
+        # Both patterns are case-insensitive, so the shared lowercased cache works here too
+        page_text = _page_text_lower(soup)
 
         # Find dollar amounts per month
-        import re
-        prices = re.findall(r'\$(\d+(?:\.\d+)?)\s*(?:\/\s*month|per month|monthly)', page_text, re.IGNORECASE)
+        prices = _PRICE_RE.findall(page_text)
 
         if prices:
             return f"${min(float(p) for p in prices)}-${max(float(p) for p in prices)}/month"
 
-        # Check for "free" mentions
-        if 'free' in page_text.lower() or 'freemium' in page_text.lower():
+        # Check for "free" mentions (case handled by the pattern, no .lower() copy)
+        if _FREE_RE.search(page_text):
             return "Free tier available"
 
         return None
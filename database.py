@@ -3,19 +3,39 @@ Database models and operations for storing and analyzing todo service features.
 Supports both SQLite (local development) and PostgreSQL (production).
 """
 import os
+import hashlib
 import json
 import sqlite3
+import threading
+import time
 from typing import List, Dict, Optional, Union, Any
 from contextlib import contextmanager
 from datetime import datetime
 from dotenv import load_dotenv
 from base_scraper import ServiceFeatures
 
+# Conditional numpy import: vectorized ranking math, pure-Python fallback
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+# Conditional orjson import: faster JSON codec for the per-row
+# platforms/schema columns, stdlib json fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 # Conditional PostgreSQL import
 try:
     import psycopg2
     from psycopg2 import pool
-    from psycopg2.extras import RealDictCursor
+    from psycopg2.extras import RealDictCursor, execute_values, Json
     POSTGRES_AVAILABLE = True
 except ImportError:
     POSTGRES_AVAILABLE = False
@@ -24,6 +44,37 @@ except ImportError:
 # Load environment variables
 load_dotenv()
 
+if ORJSON_AVAILABLE:
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    _loads = json.loads
+
+
+if ORJSON_AVAILABLE:
+    def _dumps_pretty(obj) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2)
+else:
+    def _dumps_pretty(obj) -> bytes:
+        return json.dumps(obj, indent=2, default=str).encode('utf-8')
+
+
+def _maybe_json(value):
+    """Decode a JSON column value, passing through already-decoded ones.
+
+    PG JSONB arrives from psycopg2 as dict/list and SQLite TEXT as str;
+    one isinstance check replaces the per-field try/except guards.
+    """
+    return _loads(value) if isinstance(value, (str, bytes)) else value
+
+# Canonical bit order for services.feature_bits. Append-only: new features
+# take the next free bit so packed values already on disk stay valid.
+FEATURE_ORDER = ['free_tier', 'collaboration', 'reminders', 'due_dates',
+                 'tags_labels', 'subtasks', 'attachments', 'offline_mode',
+                 'calendar_view', 'integrations', 'api_available']
+
 
 class DatabaseManager:
     """Manages database for todo service features with support for SQLite and PostgreSQL"""
@@ -33,6 +84,19 @@ class DatabaseManager:
         self.db_path = db_path or os.environ.get('DB_PATH', "todo_services.db")
         self.is_postgres = self.database_url is not None and POSTGRES_AVAILABLE
         self.pg_pool = None
+        # One long-lived SQLite connection per thread (the SQLite analogue
+        # of the PG connection pool below)
+        self._sqlite_local = threading.local()
+        # Connection pinned by an enclosing transaction() block, if any
+        self._txn_local = threading.local()
+        # In-process cache for hot read queries, cleared by write methods.
+        # Entries also expire on their own: in the deployed split (web and
+        # scrape as separate processes) the writes happen in a process this
+        # cache never sees, so without a staleness bound the API would
+        # serve its boot-time snapshot forever.
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self._cache_ttl = float(os.environ.get('DB_CACHE_TTL', 60))
         
         if self.is_postgres:
             print("Using PostgreSQL database")
@@ -43,44 +107,196 @@ class DatabaseManager:
                 print("Warning: DATABASE_URL set but psycopg2 not available. Using SQLite.")
             print(f"Using SQLite database at {self.db_path}")
             self.placeholder = "?"
-            
+            self.init_sqlite_pragmas()
+
+        self._init_sql()
         self.init_database()
 
+    def _init_sql(self):
+        """Precompute dialect-specific SQL for hot statements once.
+
+        The placeholder style is fixed at construction, so there is no
+        reason to re-interpolate these f-strings on every call.
+        """
+        p = self.placeholder
+        self.SQL = {
+            'service_by_name': f"SELECT * FROM services WHERE name = {p}",
+            'features_for_service': f"SELECT feature_name, is_available FROM features WHERE service_id = {p}",
+            'additional_features': f"SELECT feature_name FROM additional_features WHERE service_id = {p}",
+            'service_rankings': f"SELECT context, rank, score FROM rankings WHERE service_id = {p}",
+            'category_by_slug': f"SELECT * FROM categories WHERE slug = {p}",
+            'weights_for_context': f"SELECT feature_name, weight FROM feature_weights WHERE context = {p}",
+            'rankings_for_context': f"""
+                SELECT r.rank, r.score, s.name as service_name
+                FROM rankings r
+                JOIN services s ON r.service_id = s.id
+                WHERE r.context = {p}
+                ORDER BY r.rank
+            """,
+        }
+
+    def init_sqlite_pragmas(self):
+        """Apply persistent SQLite performance pragmas once at startup.
+
+        WAL lets readers proceed during writes and halves fsyncs together
+        with synchronous=NORMAL; journal_mode is persistent so this only
+        needs a bootstrap connection. Per-connection pragmas are re-applied
+        in get_connection.
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        finally:
+            conn.close()
+
     def init_pg_pool(self):
-        """Initialize PostgreSQL connection pool"""
+        """Initialize PostgreSQL connection pool.
+
+        ThreadedConnectionPool is safe to share across the threaded WSGI
+        workers (SimpleConnectionPool is not); bounds are tunable via
+        PG_POOL_MIN/PG_POOL_MAX to match the server's connection budget.
+        """
         try:
-            self.pg_pool = psycopg2.pool.SimpleConnectionPool(
-                1, 20, dsn=self.database_url
+            self.pg_pool = psycopg2.pool.ThreadedConnectionPool(
+                int(os.environ.get('PG_POOL_MIN', 2)),
+                int(os.environ.get('PG_POOL_MAX', 20)),
+                dsn=self.database_url
             )
         except Exception as e:
             print(f"Error initializing PostgreSQL pool: {e}")
             raise
 
+    def _sqlite_conn(self):
+        """This thread's SQLite connection, created on first use"""
+        conn = getattr(self._sqlite_local, 'conn', None)
+        if conn is None:
+            # isolation_level=None disables the stdlib's implicit
+            # transaction handling; we manage BEGIN/COMMIT explicitly
+            conn = sqlite3.connect(self.db_path, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            # Per-connection pragmas reset on connect, so apply here
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-64000")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._sqlite_local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        """Group several DatabaseManager calls into one transaction.
+
+        get_connection blocks opened inside join the enclosing
+        transaction instead of committing individually, so a seed of N
+        writes pays one commit (and one fsync) rather than N. Nesting
+        transaction() blocks is allowed; only the outermost commits.
+        """
+        if getattr(self._txn_local, 'conn', None) is not None:
+            yield  # already inside a transaction; join it
+            return
+
+        if self.is_postgres:
+            conn = self.pg_pool.getconn()
+            broken = False
+            self._txn_local.conn = conn
+            try:
+                conn.autocommit = False
+                yield
+                conn.commit()
+            except Exception as e:
+                try:
+                    conn.rollback()
+                except Exception:
+                    broken = True
+                raise e
+            finally:
+                self._txn_local.conn = None
+                self.pg_pool.putconn(conn, close=broken)
+        else:
+            conn = self._sqlite_conn()
+            self._txn_local.conn = conn
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                yield
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                raise e
+            finally:
+                self._txn_local.conn = None
+
     @contextmanager
-    def get_connection(self):
-        """Context manager for database connections"""
+    def get_connection(self, write: bool = False):
+        """Context manager for database connections.
+
+        Write methods pass write=True; on SQLite that takes the WAL
+        write lock up front with BEGIN IMMEDIATE. Reads use a deferred
+        transaction so concurrent readers across worker threads never
+        contend for the single write lock.
+        """
+        txn_conn = getattr(self._txn_local, 'conn', None)
+        if txn_conn is not None:
+            # Inside a transaction() block: reuse its connection and let
+            # the outermost block commit or roll back
+            yield txn_conn
+            return
         if self.is_postgres:
             conn = self.pg_pool.getconn()
-            conn.autocommit = False
+            broken = False
             try:
+                conn.autocommit = False
                 yield conn
                 conn.commit()
             except Exception as e:
-                conn.rollback()
+                # A failed rollback means the connection itself is dead
+                # (server restart, network drop); discard it so the pool
+                # hands out a fresh one next time
+                try:
+                    conn.rollback()
+                except Exception:
+                    broken = True
                 raise e
             finally:
-                self.pg_pool.putconn(conn)
+                self.pg_pool.putconn(conn, close=broken)
         else:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
+            # Reuse this thread's connection instead of connect-per-call;
+            # read paths no longer pay connect + pragma setup every query
+            conn = self._sqlite_conn()
             try:
+                # One explicit transaction per block: multi-statement writes
+                # take the WAL write lock once instead of per statement.
+                # IMMEDIATE (writes only) avoids deadlock-prone lock
+                # upgrades; reads stay deferred and run concurrently.
+                conn.execute("BEGIN IMMEDIATE" if write else "BEGIN")
                 yield conn
                 conn.commit()
             except Exception as e:
                 conn.rollback()
                 raise e
-            finally:
-                conn.close()
+
+    def _cached(self, key, loader):
+        """Return a cached read result, computing it on first use.
+
+        Hot read queries (comparison matrix, rankings, categories, weights)
+        are rebuilt identically on every dashboard call; this serves them
+        from memory until the next write invalidates or the entry ages
+        past DB_CACHE_TTL seconds — whichever comes first. Callers get
+        the cached object itself and must not mutate it.
+        """
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and time.monotonic() - entry[1] < self._cache_ttl:
+                return entry[0]
+        value = loader()
+        with self._cache_lock:
+            self._cache[key] = (value, time.monotonic())
+        return value
+
+    def _invalidate_cache(self):
+        """Drop all cached read results (called after any write)"""
+        with self._cache_lock:
+            self._cache.clear()
 
     def execute_query(self, query: str, params: tuple = None) -> Any:
         """Execute a query and return a cursor"""
@@ -100,7 +316,7 @@ class DatabaseManager:
         id_col = "SERIAL PRIMARY KEY" if self.is_postgres else "INTEGER PRIMARY KEY AUTOINCREMENT"
         json_type = "JSONB" if self.is_postgres else "TEXT"
         
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             cursor = conn.cursor()
             
             # Categories table (must be created before services for foreign key)
@@ -124,6 +340,8 @@ class DatabaseManager:
                     url TEXT NOT NULL,
                     pricing TEXT,
                     platforms TEXT,
+                    feature_bits BIGINT NOT NULL DEFAULT 0,
+                    content_hash TEXT,
                     category_id INTEGER REFERENCES categories(id),
                     scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
@@ -148,6 +366,35 @@ class DatabaseManager:
                 if 'category_id' not in columns:
                     cursor.execute("ALTER TABLE services ADD COLUMN category_id INTEGER REFERENCES categories(id)")
 
+            # Migration: Add feature_bits to services if it doesn't exist,
+            # backfilling packed values from the features table
+            if self.is_postgres:
+                cursor.execute("""
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_name='services' AND column_name='feature_bits'
+                """)
+                has_feature_bits = cursor.fetchone() is not None
+            else:
+                cursor.execute("PRAGMA table_info(services)")
+                has_feature_bits = 'feature_bits' in [info[1] for info in cursor.fetchall()]
+            if not has_feature_bits:
+                cursor.execute("ALTER TABLE services ADD COLUMN feature_bits BIGINT NOT NULL DEFAULT 0")
+                self._backfill_feature_bits(cursor)
+
+            # Migration: Add content_hash to services if it doesn't exist;
+            # NULL simply forces a full write on the next save
+            if self.is_postgres:
+                cursor.execute("""
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_name='services' AND column_name='content_hash'
+                """)
+                has_content_hash = cursor.fetchone() is not None
+            else:
+                cursor.execute("PRAGMA table_info(services)")
+                has_content_hash = 'content_hash' in [info[1] for info in cursor.fetchall()]
+            if not has_content_hash:
+                cursor.execute("ALTER TABLE services ADD COLUMN content_hash TEXT")
+
             # Features table
             cursor.execute(f"""
                 CREATE TABLE IF NOT EXISTS features (
@@ -166,7 +413,8 @@ class DatabaseManager:
                     id {id_col},
                     service_id INTEGER NOT NULL,
                     feature_name TEXT NOT NULL,
-                    FOREIGN KEY (service_id) REFERENCES services(id)
+                    FOREIGN KEY (service_id) REFERENCES services(id),
+                    UNIQUE(service_id, feature_name)
                 )
             """)
 
@@ -200,86 +448,191 @@ class DatabaseManager:
             try:
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_services_name ON services(name)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_services_category ON services(category_id)")
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_features_service ON features(service_id)")
+                # UNIQUE(service_id, feature_name) already backs service_id
+                # prefix lookups; the old single-column index just doubled
+                # write amplification
+                cursor.execute("DROP INDEX IF EXISTS idx_features_service")
+                # Migration: databases created before the UNIQUE constraint
+                # on additional_features may hold duplicates; dedupe, then a
+                # unique index gives them the same guarantee
+                cursor.execute("""
+                    DELETE FROM additional_features WHERE id NOT IN (
+                        SELECT MIN(id) FROM additional_features
+                        GROUP BY service_id, feature_name
+                    )
+                """)
+                cursor.execute("""
+                    CREATE UNIQUE INDEX IF NOT EXISTS idx_additional_features_unique
+                    ON additional_features(service_id, feature_name)
+                """)
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_rankings_context ON rankings(context)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_categories_slug ON categories(slug)")
+                if self.is_postgres:
+                    # Covering index: feature reads by service_id become
+                    # index-only scans with no heap fetch
+                    cursor.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_features_svc_cover
+                        ON features(service_id) INCLUDE (feature_name, is_available)
+                    """)
+                    # jsonb_path_ops GIN indexes: ~half the size of jsonb_ops
+                    # and faster for @> containment lookups on the JSONB columns
+                    cursor.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_categories_schema_gin
+                        ON categories USING GIN (feature_schema jsonb_path_ops)
+                    """)
+                    cursor.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_categories_contexts_gin
+                        ON categories USING GIN (ranking_contexts jsonb_path_ops)
+                    """)
             except Exception as e:
                 print(f"Warning: Could not create some indexes: {e}")
 
+    @staticmethod
+    def pack_feature_bits(feature_map: Dict[str, bool]) -> int:
+        """Pack the core boolean features into a single integer bitmask"""
+        return sum(1 << i for i, name in enumerate(FEATURE_ORDER)
+                   if feature_map.get(name, False))
+
+    @staticmethod
+    def decode_feature_bits(bits: int) -> Dict[str, bool]:
+        """Decode a services.feature_bits value back into a feature map"""
+        return {name: bool(bits >> i & 1) for i, name in enumerate(FEATURE_ORDER)}
+
+    def _json_param(self, obj):
+        """Adapt a dict/list for a JSON column bind.
+
+        On PG this wraps with psycopg2.extras.Json so the driver binds
+        native JSONB without a server-side text reparse; on SQLite the
+        column is TEXT so a serialized string is bound instead.
+        """
+        if obj is None:
+            return None
+        if self.is_postgres:
+            return Json(obj, dumps=_dumps)
+        return _dumps(obj)
+
+    def _backfill_feature_bits(self, cursor):
+        """Populate feature_bits from existing features rows (migration only)"""
+        p = self.placeholder
+        try:
+            cursor.execute("SELECT service_id, feature_name, is_available FROM features")
+        except Exception:
+            # Fresh database: features table not created yet, nothing to backfill
+            return
+        bits_by_service = {}
+        for service_id, feature_name, is_available in cursor.fetchall():
+            bits_by_service.setdefault(service_id, {})[feature_name] = bool(is_available)
+        for service_id, feature_map in bits_by_service.items():
+            cursor.execute(f"UPDATE services SET feature_bits = {p} WHERE id = {p}",
+                           (self.pack_feature_bits(feature_map), service_id))
+
     def save_service_features(self, features: ServiceFeatures) -> int:
         """Save or update a service and its features"""
         p = self.placeholder
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             if self.is_postgres:
                 cursor = conn.cursor(cursor_factory=RealDictCursor)
             else:
                 cursor = conn.cursor()
 
+            feature_map = {
+                'free_tier': features.free_tier,
+                'collaboration': features.collaboration,
+                'reminders': features.reminders,
+                'due_dates': features.due_dates,
+                'tags_labels': features.tags_labels,
+                'subtasks': features.subtasks,
+                'attachments': features.attachments,
+                'offline_mode': features.offline_mode,
+                'calendar_view': features.calendar_view,
+                'integrations': features.integrations,
+                'api_available': features.api_available,
+            }
+            feature_bits = self.pack_feature_bits(feature_map)
+
+            # Hash everything the write would store; a matching stored hash
+            # means this scrape produced identical data and every statement
+            # below (plus the cache invalidation) can be skipped
+            content_hash = hashlib.sha1(_dumps([
+                features.url, features.pricing, features.platforms,
+                feature_map, features.additional_features or []
+            ]).encode()).hexdigest()
+
             # Check if service exists
-            cursor.execute(f"SELECT id FROM services WHERE name = {p}", (features.name,))
+            cursor.execute(f"SELECT id, content_hash FROM services WHERE name = {p}", (features.name,))
             row = cursor.fetchone()
 
             if row:
                 service_id = row['id']
+                if row['content_hash'] == content_hash:
+                    return service_id
                 cursor.execute(f"""
-                    UPDATE services SET url={p}, pricing={p}, platforms={p}, last_updated={p} WHERE id={p}
-                """, (features.url, features.pricing, json.dumps(features.platforms), datetime.now(), service_id))
+                    UPDATE services SET url={p}, pricing={p}, platforms={p}, feature_bits={p}, content_hash={p}, last_updated={p} WHERE id={p}
+                """, (features.url, features.pricing, self._json_param(features.platforms),
+                      feature_bits, content_hash, datetime.now(), service_id))
             else:
                 cursor.execute(f"""
-                    INSERT INTO services (name, url, pricing, platforms, last_updated)
-                    VALUES ({p}, {p}, {p}, {p}, {p})
+                    INSERT INTO services (name, url, pricing, platforms, feature_bits, content_hash, last_updated)
+                    VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p})
                     RETURNING id
                 """ if self.is_postgres else f"""
-                    INSERT INTO services (name, url, pricing, platforms, last_updated)
-                    VALUES ({p}, {p}, {p}, {p}, {p})
+                    INSERT INTO services (name, url, pricing, platforms, feature_bits, content_hash, last_updated)
+                    VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p})
                 """, (features.name, features.url, features.pricing,
-                      json.dumps(features.platforms), datetime.now()))
-                
+                      self._json_param(features.platforms), feature_bits,
+                      content_hash, datetime.now()))
+
                 if self.is_postgres:
                     service_id = cursor.fetchone()['id']
                 else:
                     service_id = cursor.lastrowid
 
-            # Save features
-            feature_map = {
-                'free_tier': features.free_tier,
-                'collaboration': features.collaboration,
-                'reminders': features.reminders,
-                'due_dates': features.due_dates,
-                'tags_labels': features.tags_labels,
-                'subtasks': features.subtasks,
-                'attachments': features.attachments,
-                'offline_mode': features.offline_mode,
-                'calendar_view': features.calendar_view,
-                'integrations': features.integrations,
-                'api_available': features.api_available,
-            }
+            # Save features (rows kept alongside the packed bitmask so
+            # existing JOIN-based readers keep working)
 
-            # Handle UPSERT for features
-            for feature_name, is_available in feature_map.items():
-                if self.is_postgres:
-                    cursor.execute(f"""
-                        INSERT INTO features (service_id, feature_name, is_available)
-                        VALUES ({p}, {p}, {p})
-                        ON CONFLICT (service_id, feature_name) 
-                        DO UPDATE SET is_available = EXCLUDED.is_available
-                    """, (service_id, feature_name, is_available))
-                else:
-                    cursor.execute(f"""
-                        INSERT OR REPLACE INTO features (service_id, feature_name, is_available)
-                        VALUES ({p}, {p}, {p})
-                    """, (service_id, feature_name, is_available))
+            # Batched UPSERT: one statement per table instead of one per feature
+            feature_rows = [(service_id, feature_name, is_available)
+                            for feature_name, is_available in feature_map.items()]
+            if self.is_postgres:
+                execute_values(cursor, """
+                    INSERT INTO features (service_id, feature_name, is_available)
+                    VALUES %s
+                    ON CONFLICT (service_id, feature_name)
+                    DO UPDATE SET is_available = EXCLUDED.is_available
+                """, feature_rows)
+            else:
+                cursor.executemany(f"""
+                    INSERT OR REPLACE INTO features (service_id, feature_name, is_available)
+                    VALUES ({p}, {p}, {p})
+                """, feature_rows)
 
-            # Clear and save additional features
-            cursor.execute(f"DELETE FROM additional_features WHERE service_id = {p}", (service_id,))
-            if features.additional_features:
-                for f in features.additional_features:
-                    cursor.execute(f"""
+            # Reconcile additional features: conflict-ignoring inserts plus a
+            # targeted delete of dropped names, so an unchanged feature list
+            # writes nothing instead of a full delete/re-insert cycle
+            extra = features.additional_features or []
+            if extra:
+                extra_rows = [(service_id, f) for f in extra]
+                if self.is_postgres:
+                    execute_values(cursor, """
                         INSERT INTO additional_features (service_id, feature_name)
+                        VALUES %s
+                        ON CONFLICT (service_id, feature_name) DO NOTHING
+                    """, extra_rows)
+                else:
+                    cursor.executemany(f"""
+                        INSERT OR IGNORE INTO additional_features (service_id, feature_name)
                         VALUES ({p}, {p})
-                    """, (service_id, f))
+                    """, extra_rows)
+                marks = ','.join([p] * len(extra))
+                cursor.execute(f"""
+                    DELETE FROM additional_features
+                    WHERE service_id = {p} AND feature_name NOT IN ({marks})
+                """, (service_id, *extra))
+            else:
+                cursor.execute(f"DELETE FROM additional_features WHERE service_id = {p}", (service_id,))
 
-            return service_id
+        self._invalidate_cache()
+        return service_id
 
     def get_all_services(self, category_slug: str = None) -> List[Dict]:
         """Get all services with their features as a map, optionally filtered by category"""
@@ -289,30 +642,48 @@ class DatabaseManager:
                 cursor = conn.cursor(cursor_factory=RealDictCursor)
             else:
                 cursor = conn.cursor()
-            
+
             if category_slug:
-                # Get category id first
-                cursor.execute(f"SELECT id FROM categories WHERE slug = {p}", (category_slug,))
-                cat_row = cursor.fetchone()
-                if cat_row:
-                    cat_id = cat_row['id'] if self.is_postgres else cat_row[0]
-                    cursor.execute(f"SELECT * FROM services WHERE category_id = {p} ORDER BY name", (cat_id,))
-                else:
-                    return []
+                # Single JOIN instead of resolving the category id in a
+                # separate round-trip; unknown slugs fall out as []
+                cursor.execute(f"""
+                    SELECT s.* FROM services s
+                    JOIN categories c ON c.id = s.category_id
+                    WHERE c.slug = {p}
+                    ORDER BY s.name
+                """, (category_slug,))
             else:
                 cursor.execute("SELECT * FROM services ORDER BY name")
-            
+
             services = [dict(row) for row in cursor.fetchall()]
+            if not services:
+                return []
 
+            # Bulk-fetch features for every listed service in two queries
+            # instead of two queries per service (the old 1+2N pattern)
+            by_id = {}
             for service in services:
-                service['features'] = self.get_features_for_service(service['id'])
-                service['additional_features'] = self.get_additional_features(service['id'])
-                # Parse platforms from JSON string
-                if isinstance(service['platforms'], str):
-                    try:
-                        service['platforms'] = json.loads(service['platforms'])
-                    except:
-                        pass
+                service['features'] = {}
+                service['additional_features'] = []
+                service['platforms'] = _maybe_json(service['platforms'])
+                by_id[service['id']] = service
+
+            marks = ','.join([p] * len(by_id))
+            ids = tuple(by_id)
+            cursor.execute(f"""
+                SELECT service_id, feature_name, is_available
+                FROM features WHERE service_id IN ({marks})
+            """, ids)
+            for row in cursor.fetchall():
+                by_id[row['service_id']]['features'][row['feature_name']] = bool(row['is_available'])
+
+            cursor.execute(f"""
+                SELECT service_id, feature_name
+                FROM additional_features WHERE service_id IN ({marks})
+            """, ids)
+            for row in cursor.fetchall():
+                by_id[row['service_id']]['additional_features'].append(row['feature_name'])
+
             return services
 
     def get_service_with_features(self, name: str) -> Optional[Dict]:
@@ -323,62 +694,64 @@ class DatabaseManager:
         
         service['features'] = self.get_features_for_service(service['id'])
         service['additional_features'] = self.get_additional_features(service['id'])
-        if isinstance(service['platforms'], str):
-            try:
-                service['platforms'] = json.loads(service['platforms'])
-            except:
-                pass
+        service['platforms'] = _maybe_json(service['platforms'])
         return service
 
     def get_service_by_name(self, name: str) -> Optional[Dict]:
         """Get a specific service by name"""
-        p = self.placeholder
         with self.get_connection() as conn:
             if self.is_postgres:
                 cursor = conn.cursor(cursor_factory=RealDictCursor)
             else:
                 cursor = conn.cursor()
-            cursor.execute(f"SELECT * FROM services WHERE name = {p}", (name,))
+            cursor.execute(self.SQL['service_by_name'], (name,))
             row = cursor.fetchone()
             return dict(row) if row else None
 
     def get_feature_comparison(self, category_slug: str = None) -> Dict:
         """Get a feature comparison matrix for services, optionally filtered by category"""
+        return self._cached(('feat_cmp', category_slug),
+                            lambda: self._fetch_feature_comparison(category_slug))
+
+    def _fetch_feature_comparison(self, category_slug: str = None) -> Dict:
         p = self.placeholder
+        # Aggregate the feature map per service in SQL: one row per service
+        # comes back instead of one per (service, feature) cell
+        agg = "jsonb_object_agg" if self.is_postgres else "json_group_object"
         with self.get_connection() as conn:
             if self.is_postgres:
-                cursor = conn.cursor(cursor_factory=RealDictCursor)
+                cursor = conn.cursor(name='feat_cmp_stream', cursor_factory=RealDictCursor)
+                cursor.itersize = 5000
             else:
                 cursor = conn.cursor()
-            
-            query = """
-                SELECT s.name, f.feature_name, f.is_available
+
+            query = f"""
+                SELECT s.name, {agg}(f.feature_name, f.is_available) AS feats
                 FROM services s
                 JOIN features f ON s.id = f.service_id
             """
             params = []
-            
+
             if category_slug:
                 query += f" JOIN categories c ON s.category_id = c.id WHERE c.slug = {p} "
                 params.append(category_slug)
-                
-            query += " ORDER BY s.name, f.feature_name "
-            
-            cursor.execute(query, tuple(params))
 
-            comparison = {}
-            for row in cursor.fetchall():
-                name = row['name']
-                if name not in comparison:
-                    comparison[name] = {}
-                comparison[name][row['feature_name']] = bool(row['is_available'])
+            query += " GROUP BY s.name ORDER BY s.name "
+
+            cursor.execute(query, tuple(params))
 
+            # Iterate the cursor directly (streamed on PG); SQLite
+            # aggregates its 0/1 booleans, so normalize values here
+            comparison = {row['name']: {feature: bool(available)
+                                        for feature, available in _maybe_json(row['feats']).items()}
+                          for row in cursor}
+            cursor.close()
             return comparison
 
     def set_feature_weights(self, context: str, weights: Dict[str, float]):
         """Set feature weights for a specific context"""
         p = self.placeholder
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             if self.is_postgres:
                 cursor = conn.cursor()
             else:
@@ -401,18 +774,19 @@ class DatabaseManager:
                         VALUES ({p}, {p}, {p})
                     """, (context, feature_name, weight))
 
+        self._invalidate_cache()
+
     def get_feature_weights(self, context: str) -> Dict[str, float]:
         """Get feature weights for a context"""
-        p = self.placeholder
+        return self._cached(('weights', context), lambda: self._fetch_feature_weights(context))
+
+    def _fetch_feature_weights(self, context: str) -> Dict[str, float]:
         with self.get_connection() as conn:
-            if self.is_postgres:
-                cursor = conn.cursor(cursor_factory=RealDictCursor)
-            else:
-                cursor = conn.cursor()
-            cursor.execute(f"""
-                SELECT feature_name, weight FROM feature_weights WHERE context = {p}
-            """, (context,))
-            return {row['feature_name']: row['weight'] for row in cursor.fetchall()}
+            # Tuple cursor: these narrow reads consume every column by
+            # position, so per-row dict building is pure overhead
+            cursor = conn.cursor()
+            cursor.execute(self.SQL['weights_for_context'], (context,))
+            return {feature_name: weight for feature_name, weight in cursor.fetchall()}
 
     def calculate_rankings(self, context: str, weights: Optional[Dict[str, float]] = None) -> List[Dict]:
         """Calculate and save rankings for a specific context"""
@@ -426,37 +800,119 @@ class DatabaseManager:
                                'calendar_view', 'integrations', 'api_available']
                 weights = {f: 1.0 for f in all_features}
 
-        # Get all services and calculate scores
+        services_map = self._fetch_services_bits()
+        scores = self._score_services(services_map, weights)
+        for i, item in enumerate(scores, 1):
+            item['rank'] = i
+
+        now = datetime.now()
+        self._save_rankings([(context, item['service_id'], item['rank'], item['score'], now)
+                             for item in scores])
+        self._invalidate_cache()
+        return scores
+
+    def calculate_rankings_bulk(self, weights_by_context: Dict[str, Dict[str, float]]) -> Dict[str, List[Dict]]:
+        """Calculate and save rankings for several contexts in one pass.
+
+        The service feature matrix (packed bits) is fetched once and every
+        context's weight vector is scored against that snapshot; rankings
+        for all contexts persist in a single batched statement and the read
+        cache is invalidated once, instead of per context.
+        """
+        for context, weights in weights_by_context.items():
+            self.set_feature_weights(context, weights)
+
+        services_map = self._fetch_services_bits()
+
+        results = {}
+        rows = []
+        now = datetime.now()
+        for context, weights in weights_by_context.items():
+            scores = self._score_services(services_map, weights)
+            for i, item in enumerate(scores, 1):
+                item['rank'] = i
+            results[context] = scores
+            rows.extend((context, item['service_id'], item['rank'], item['score'], now)
+                        for item in scores)
+
+        self._save_rankings(rows)
+        self._invalidate_cache()
+        return results
+
+    def _fetch_services_bits(self) -> Dict[int, Dict]:
+        """Fetch {id: {'name', 'bits'}} for every service, streamed"""
         with self.get_connection() as conn:
             if self.is_postgres:
-                cursor = conn.cursor(cursor_factory=RealDictCursor)
+                # Named cursor streams from the server in itersize batches
+                # instead of buffering every row client-side
+                cursor = conn.cursor(name='svc_bits_stream', cursor_factory=RealDictCursor)
+                cursor.itersize = 5000
             else:
                 cursor = conn.cursor()
-                
-            cursor.execute("""
-                SELECT s.id, s.name, f.feature_name, f.is_available 
-                FROM services s
-                LEFT JOIN features f ON s.id = f.service_id
-                ORDER BY s.name
-            """)
-            rows = cursor.fetchall()
 
-        # Group features by service
-        services_map = {}
-        for row in rows:
-            s_id = row['id']
-            if s_id not in services_map:
-                services_map[s_id] = {'name': row['name'], 'features': {}}
-            if row['feature_name']:
-                services_map[s_id]['features'][row['feature_name']] = bool(row['is_available'])
+            # feature_bits carries all 11 core booleans, so no JOIN against
+            # the features table and no per-row reshape is needed
+            cursor.execute("SELECT id, name, feature_bits FROM services ORDER BY name")
+            services_map = {row['id']: {'name': row['name'], 'bits': row['feature_bits'] or 0}
+                            for row in cursor}
+            cursor.close()
+        return services_map
+
+    def _save_rankings(self, rows):
+        """Persist (context, service_id, rank, score, calculated_at) rows batched"""
+        p = self.placeholder
+        with self.get_connection(write=True) as conn:
+            cursor = conn.cursor()
+            if self.is_postgres:
+                execute_values(cursor, """
+                    INSERT INTO rankings (context, service_id, rank, score, calculated_at)
+                    VALUES %s
+                    ON CONFLICT (context, service_id) DO UPDATE SET
+                        rank = EXCLUDED.rank,
+                        score = EXCLUDED.score,
+                        calculated_at = EXCLUDED.calculated_at
+                """, rows, page_size=500)
+            else:
+                cursor.executemany(f"""
+                    INSERT OR REPLACE INTO rankings (context, service_id, rank, score, calculated_at)
+                    VALUES ({p}, {p}, {p}, {p}, {p})
+                """, rows)
+
+    @staticmethod
+    def _score_services(services_map: Dict, weights: Dict[str, float]) -> List[Dict]:
+        """Score and sort services by weighted feature availability.
+
+        Each service contributes its packed feature_bits value; with numpy
+        the bits unpack into an (services x features) 0/1 matrix whose
+        product with the weight vector scores everything in one compiled
+        kernel, with a bit-test loop as fallback. Weights for features
+        outside FEATURE_ORDER score zero, matching the old behavior for
+        features no scraper records. Returns score dicts sorted
+        descending, ties in first-seen order.
+        """
+        if NUMPY_AVAILABLE and services_map:
+            service_ids = list(services_map)
+            bits = np.fromiter((services_map[s_id]['bits'] for s_id in service_ids),
+                               dtype=np.int64, count=len(service_ids))
+            weight_vec = np.fromiter((weights.get(name, 0.0) for name in FEATURE_ORDER),
+                                     dtype=np.float64, count=len(FEATURE_ORDER))
+            shifts = np.arange(len(FEATURE_ORDER), dtype=np.int64)
+            matrix = ((bits[:, None] >> shifts) & 1).astype(np.float64)
+            score_vec = matrix @ weight_vec
+            order = np.argsort(-score_vec, kind='stable')
+            return [{
+                'service_id': service_ids[i],
+                'service_name': services_map[service_ids[i]]['name'],
+                'score': float(score_vec[i])
+            } for i in order]
 
         scores = []
         for service_id, data in services_map.items():
-            features = data['features']
+            bits = data['bits']
             score = 0.0
-            for feature_name, weight in weights.items():
-                if features.get(feature_name, False):
-                    score += weight
+            for i, name in enumerate(FEATURE_ORDER):
+                if bits >> i & 1:
+                    score += weights.get(name, 0.0)
 
             scores.append({
                 'service_id': service_id,
@@ -465,84 +921,43 @@ class DatabaseManager:
             })
 
         scores.sort(key=lambda x: x['score'], reverse=True)
-        for i, item in enumerate(scores, 1):
-            item['rank'] = i
-
-        # Save rankings to database
-        p = self.placeholder
-        with self.get_connection() as conn:
-            if self.is_postgres:
-                cursor = conn.cursor()
-            else:
-                cursor = conn.cursor()
-                
-            for item in scores:
-                if self.is_postgres:
-                    cursor.execute(f"""
-                        INSERT INTO rankings (context, service_id, rank, score, calculated_at)
-                        VALUES ({p}, {p}, {p}, {p}, {p})
-                        ON CONFLICT (context, service_id) DO UPDATE SET 
-                            rank = EXCLUDED.rank, 
-                            score = EXCLUDED.score, 
-                            calculated_at = EXCLUDED.calculated_at
-                    """, (context, item['service_id'], item['rank'], item['score'], datetime.now()))
-                else:
-                    cursor.execute(f"""
-                        INSERT OR REPLACE INTO rankings (context, service_id, rank, score, calculated_at)
-                        VALUES ({p}, {p}, {p}, {p}, {p})
-                    """, (context, item['service_id'], item['rank'], item['score'], datetime.now()))
-
         return scores
 
     def get_rankings(self, context: str) -> List[Dict]:
         """Get rankings for a specific context"""
-        p = self.placeholder
+        return self._cached(('rankings', context), lambda: self._fetch_rankings(context))
+
+    def _fetch_rankings(self, context: str) -> List[Dict]:
         with self.get_connection() as conn:
             if self.is_postgres:
                 cursor = conn.cursor(cursor_factory=RealDictCursor)
             else:
                 cursor = conn.cursor()
-            cursor.execute(f"""
-                SELECT r.rank, r.score, s.name as service_name
-                FROM rankings r
-                JOIN services s ON r.service_id = s.id
-                WHERE r.context = {p}
-                ORDER BY r.rank
-            """, (context,))
+            cursor.execute(self.SQL['rankings_for_context'], (context,))
             return [dict(row) for row in cursor.fetchall()]
 
     def get_features_for_service(self, service_id: int) -> Dict[str, bool]:
         """Get core features for a specific service"""
-        p = self.placeholder
         with self.get_connection() as conn:
-            if self.is_postgres:
-                cursor = conn.cursor(cursor_factory=RealDictCursor)
-            else:
-                cursor = conn.cursor()
-            cursor.execute(f"SELECT feature_name, is_available FROM features WHERE service_id = {p}", (service_id,))
-            return {row['feature_name']: bool(row['is_available']) for row in cursor.fetchall()}
+            cursor = conn.cursor()
+            cursor.execute(self.SQL['features_for_service'], (service_id,))
+            return {feature_name: bool(is_available)
+                    for feature_name, is_available in cursor.fetchall()}
 
     def get_additional_features(self, service_id: int) -> List[str]:
         """Get additional features for a specific service"""
-        p = self.placeholder
         with self.get_connection() as conn:
-            if self.is_postgres:
-                cursor = conn.cursor(cursor_factory=RealDictCursor)
-            else:
-                cursor = conn.cursor()
-            cursor.execute(f"SELECT feature_name FROM additional_features WHERE service_id = {p}", (service_id,))
-            return [row['feature_name'] for row in cursor.fetchall()]
+            cursor = conn.cursor()
+            cursor.execute(self.SQL['additional_features'], (service_id,))
+            return [row[0] for row in cursor.fetchall()]
 
     def get_service_rankings(self, service_id: int) -> Dict[str, Dict]:
         """Get rankings for a service across all contexts"""
-        p = self.placeholder
         with self.get_connection() as conn:
-            if self.is_postgres:
-                cursor = conn.cursor(cursor_factory=RealDictCursor)
-            else:
-                cursor = conn.cursor()
-            cursor.execute(f"SELECT context, rank, score FROM rankings WHERE service_id = {p}", (service_id,))
-            return {row['context']: {'rank': row['rank'], 'score': row['score']} for row in cursor.fetchall()}
+            cursor = conn.cursor()
+            cursor.execute(self.SQL['service_rankings'], (service_id,))
+            return {context: {'rank': rank, 'score': score}
+                    for context, rank, score in cursor.fetchall()}
 
     # ==================== Category Methods ====================
 
@@ -550,14 +965,14 @@ class DatabaseManager:
                      feature_schema: Dict = None, ranking_contexts: Dict = None) -> int:
         """Add a new category"""
         p = self.placeholder
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             if self.is_postgres:
                 cursor = conn.cursor(cursor_factory=RealDictCursor)
             else:
                 cursor = conn.cursor()
             
-            feature_json = json.dumps(feature_schema) if feature_schema else None
-            contexts_json = json.dumps(ranking_contexts) if ranking_contexts else None
+            feature_json = self._json_param(feature_schema)
+            contexts_json = self._json_param(ranking_contexts)
             
             if self.is_postgres:
                 cursor.execute(f"""
@@ -570,16 +985,22 @@ class DatabaseManager:
                         ranking_contexts = EXCLUDED.ranking_contexts
                     RETURNING id
                 """, (name, slug, description, feature_json, contexts_json))
-                return cursor.fetchone()['id']
+                category_id = cursor.fetchone()['id']
             else:
                 cursor.execute(f"""
                     INSERT OR REPLACE INTO categories (name, slug, description, feature_schema, ranking_contexts)
                     VALUES ({p}, {p}, {p}, {p}, {p})
                 """, (name, slug, description, feature_json, contexts_json))
-                return cursor.lastrowid
+                category_id = cursor.lastrowid
+
+        self._invalidate_cache()
+        return category_id
 
     def get_categories(self) -> List[Dict]:
         """Get all categories"""
+        return self._cached(('categories',), self._fetch_categories)
+
+    def _fetch_categories(self) -> List[Dict]:
         with self.get_connection() as conn:
             if self.is_postgres:
                 cursor = conn.cursor(cursor_factory=RealDictCursor)
@@ -589,58 +1010,41 @@ class DatabaseManager:
             cursor.execute("SELECT * FROM categories ORDER BY name")
             categories = [dict(row) for row in cursor.fetchall()]
             
-            # Parse JSON fields
             for cat in categories:
-                if cat.get('feature_schema') and isinstance(cat['feature_schema'], str):
-                    try:
-                        cat['feature_schema'] = json.loads(cat['feature_schema'])
-                    except:
-                        pass
-                if cat.get('ranking_contexts') and isinstance(cat['ranking_contexts'], str):
-                    try:
-                        cat['ranking_contexts'] = json.loads(cat['ranking_contexts'])
-                    except:
-                        pass
-            
+                cat['feature_schema'] = _maybe_json(cat['feature_schema'])
+                cat['ranking_contexts'] = _maybe_json(cat['ranking_contexts'])
+
             return categories
 
     def get_category_by_slug(self, slug: str) -> Optional[Dict]:
         """Get a category by its slug"""
-        p = self.placeholder
         with self.get_connection() as conn:
             if self.is_postgres:
                 cursor = conn.cursor(cursor_factory=RealDictCursor)
             else:
                 cursor = conn.cursor()
             
-            cursor.execute(f"SELECT * FROM categories WHERE slug = {p}", (slug,))
+            cursor.execute(self.SQL['category_by_slug'], (slug,))
             row = cursor.fetchone()
             
             if not row:
                 return None
             
             cat = dict(row)
-            # Parse JSON fields
-            if cat.get('feature_schema') and isinstance(cat['feature_schema'], str):
-                try:
-                    cat['feature_schema'] = json.loads(cat['feature_schema'])
-                except:
-                    pass
-            if cat.get('ranking_contexts') and isinstance(cat['ranking_contexts'], str):
-                try:
-                    cat['ranking_contexts'] = json.loads(cat['ranking_contexts'])
-                except:
-                    pass
-            
+            cat['feature_schema'] = _maybe_json(cat['feature_schema'])
+            cat['ranking_contexts'] = _maybe_json(cat['ranking_contexts'])
+
             return cat
 
     def assign_service_to_category(self, service_id: int, category_id: int):
         """Assign a service to a category"""
         p = self.placeholder
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             cursor = conn.cursor()
             cursor.execute(f"UPDATE services SET category_id = {p} WHERE id = {p}", (category_id, service_id))
 
+        self._invalidate_cache()
+
     def export_to_json(self, output_file: str):
         """Export all data to JSON file"""
         data = {
@@ -649,8 +1053,8 @@ class DatabaseManager:
             'exported_at': datetime.now().isoformat()
         }
 
-        with open(output_file, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        with open(output_file, 'wb') as f:
+            f.write(_dumps_pretty(data))
 
 
 # Default feature weights for different contexts (kept for reference and initialization)
@@ -14,30 +14,58 @@ Usage:
 """
 import sys
 import argparse
-from database import DatabaseManager
-from ranking_system import RankingSystem
-from scrapers import SCRAPERS
 
+# Heavy modules (database/ranking/scraping stacks) are imported inside the
+# handlers that need them, so lightweight commands don't pay for them at
+# startup
+
+# Accepted affirmative answers for interactive prompts; one frozenset
+# allocated at import instead of a list literal per question
+_YES = frozenset({'y', 'yes', 'true', '1'})
+
+
+def scrape_all_services(db):
+    """Scrape features from all registered services.
+
+    Fetches run concurrently over one shared HTTP session (wall time is
+    the slowest host instead of the sum of all of them); DB writes stay
+    sequential afterwards. Falls back to the serial loop without aiohttp.
+    """
+    from base_scraper import AIOHTTP_AVAILABLE, scrape_many
+    from scrapers import SCRAPERS
 
-def scrape_all_services(db: DatabaseManager):
-    """Scrape features from all registered services"""
     print("\n" + "="*60)
     print("SCRAPING ALL TODO SERVICES")
     print("="*60 + "\n")
 
+    names = list(SCRAPERS)
+    scrapers = [SCRAPERS[name]() for name in names]
+
+    if AIOHTTP_AVAILABLE:
+        print(f"Scraping {len(names)} services concurrently...\n")
+        outcomes = scrape_many(scrapers)
+    else:
+        outcomes = []
+        for name, scraper in zip(names, scrapers):
+            print(f"Scraping {name}...")
+            try:
+                outcomes.append(scraper.scrape())
+            except Exception as e:
+                outcomes.append(e)
+
     results = []
-    for name, scraper_factory in SCRAPERS.items():
-        print(f"Scraping {name}...")
+    for name, outcome in zip(names, outcomes):
+        if isinstance(outcome, Exception):
+            results.append((name, False, str(outcome)))
+            print(f"  ✗ {name}: {outcome}")
+            continue
         try:
-            scraper = scraper_factory()
-            features = scraper.scrape()
-            service_id = db.save_service_features(features)
+            service_id = db.save_service_features(outcome)
             results.append((name, True, service_id))
-            print(f"  ✓ Success - saved features to database")
+            print(f"  ✓ {name} - saved features to database")
         except Exception as e:
             results.append((name, False, str(e)))
-            print(f"  ✗ Error: {e}")
-        print()
+            print(f"  ✗ {name}: {e}")
 
     # Summary
     success_count = sum(1 for r in results if r[1])
@@ -48,8 +76,10 @@ def scrape_all_services(db: DatabaseManager):
     return results
 
 
-def scrape_single_service(db: DatabaseManager, service_name: str):
+def scrape_single_service(db, service_name: str):
     """Scrape a single service by name"""
+    from scrapers import SCRAPERS
+
     print(f"\nScraping {service_name}...")
 
     if service_name not in SCRAPERS:
@@ -59,7 +89,9 @@ def scrape_single_service(db: DatabaseManager, service_name: str):
 
     try:
         scraper = SCRAPERS[service_name]()
-        features = scraper.scrape()
+        # Memoized per URL: re-running the command in one process (or
+        # after a full crawl) reuses the already-extracted features
+        features = scraper.scrape_cached()
         db.save_service_features(features)
         print(f"✓ Successfully scraped and saved {service_name}")
         return True
@@ -68,8 +100,9 @@ def scrape_single_service(db: DatabaseManager, service_name: str):
         return False
 
 
-def generate_rankings(db: DatabaseManager):
+def generate_rankings(db):
     """Generate rankings for all contexts"""
+    from ranking_system import RankingSystem
     ranking_system = RankingSystem(db)
     ranking_system.generate_all_rankings()
 
@@ -79,20 +112,23 @@ def generate_rankings(db: DatabaseManager):
         ranking_system.display_rankings(context, top_n=5)
 
 
-def show_comparison(db: DatabaseManager):
+def show_comparison(db):
     """Show feature comparison matrix"""
+    from ranking_system import RankingSystem
     ranking_system = RankingSystem(db)
     ranking_system.display_feature_comparison()
 
 
-def show_service_summary(db: DatabaseManager, service_name: str):
+def show_service_summary(db, service_name: str):
     """Show detailed summary of a service"""
+    from ranking_system import RankingSystem
     ranking_system = RankingSystem(db)
     ranking_system.display_service_summary(service_name)
 
 
-def interactive_recommendation(db: DatabaseManager):
+def interactive_recommendation(db):
     """Interactive service recommendation"""
+    from ranking_system import RankingSystem
     ranking_system = RankingSystem(db)
 
     print("\n" + "="*60)
@@ -128,7 +164,7 @@ def interactive_recommendation(db: DatabaseManager):
     requirements = {}
     for feature, question in questions.items():
         answer = input(question).strip().lower()
-        requirements[feature] = answer in ['y', 'yes']
+        requirements[feature] = answer in _YES
 
     # Get recommendations
     recommendations = ranking_system.recommend_service(requirements, context)
@@ -144,8 +180,9 @@ def interactive_recommendation(db: DatabaseManager):
         print("No services match your exact requirements. Try relaxing some constraints.")
 
 
-def export_data(db: DatabaseManager):
+def export_data(db):
     """Export database to JSON"""
+    from ranking_system import RankingSystem
     ranking_system = RankingSystem(db)
 
     print("\nExporting data...")
@@ -159,7 +196,7 @@ def export_data(db: DatabaseManager):
     print("\n✓ Export complete!")
 
 
-def run_full_pipeline(db: DatabaseManager):
+def run_full_pipeline(db):
     """Run complete pipeline: scrape -> rank -> export"""
     print("\n" + "="*60)
     print("RUNNING FULL PIPELINE")
@@ -183,11 +220,32 @@ def run_full_pipeline(db: DatabaseManager):
 
 def list_services():
     """List all available services to scrape"""
+    # The lightweight registry knows the names without importing the
+    # scraping stack
+    from scraper_registry import SCRAPER_NAMES
+
     print("\nAvailable services:")
-    for name in SCRAPERS.keys():
+    for name in SCRAPER_NAMES:
         print(f"  - {name}")
 
 
+# Command handlers keyed by name: O(1) dispatch, and adding a command is
+# one entry here plus the argparse choice
+COMMANDS = {
+    'scrape': lambda db, args: scrape_all_services(db),
+    'scrape-single': lambda db, args: scrape_single_service(db, args.service),
+    'rank': lambda db, args: generate_rankings(db),
+    'compare': lambda db, args: show_comparison(db),
+    'summary': lambda db, args: show_service_summary(db, args.service),
+    'recommend': lambda db, args: interactive_recommendation(db),
+    'export': lambda db, args: export_data(db),
+    'all': lambda db, args: run_full_pipeline(db),
+}
+
+# Commands that need --service
+_REQUIRES_SERVICE = frozenset({'scrape-single', 'summary'})
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Todo Service Feature Scraper and Ranking System",
@@ -215,47 +273,24 @@ Examples:
 
     args = parser.parse_args()
 
-    # Initialize database
-    db = DatabaseManager()
-
     # If no command provided, show help
     if not args.command:
         parser.print_help()
         return
 
-    # Execute command
-    if args.command == 'scrape':
-        scrape_all_services(db)
-
-    elif args.command == 'scrape-single':
-        if not args.service:
-            print("Error: --service argument required for scrape-single")
-            return
-        scrape_single_service(db, args.service)
-
-    elif args.command == 'rank':
-        generate_rankings(db)
-
-    elif args.command == 'compare':
-        show_comparison(db)
-
-    elif args.command == 'summary':
-        if not args.service:
-            print("Error: --service argument required for summary")
-            return
-        show_service_summary(db, args.service)
-
-    elif args.command == 'recommend':
-        interactive_recommendation(db)
-
-    elif args.command == 'export':
-        export_data(db)
-
-    elif args.command == 'all':
-        run_full_pipeline(db)
+    if args.command in _REQUIRES_SERVICE and not args.service:
+        print(f"Error: --service argument required for {args.command}")
+        return
 
-    elif args.command == 'list':
+    # 'list' needs no database; everything else initializes one lazily so
+    # the DB stack isn't imported just to print the registry
+    if args.command == 'list':
         list_services()
+        return
+
+    from database import DatabaseManager
+    db = DatabaseManager()
+    COMMANDS[args.command](db, args)
 
 
 if __name__ == "__main__":
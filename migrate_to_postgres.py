@@ -8,17 +8,25 @@ import sqlite3
 import json
 from datetime import datetime
 
+from database import FEATURE_ORDER
+
 # Conditional PostgreSQL import
 try:
     import psycopg2
-    from psycopg2.extras import RealDictCursor
+    from psycopg2.extras import RealDictCursor, execute_values
 except ImportError:
     print("Error: psycopg2 is required. Install with: pip install psycopg2-binary")
     exit(1)
 
-def migrate_data(sqlite_path: str, postgres_url: str):
-    """Migrate all data from SQLite to PostgreSQL"""
-    
+def migrate_data(sqlite_path: str, postgres_url: str, verbose: bool = False):
+    """Migrate all data from SQLite to PostgreSQL.
+
+    Per-row progress lines are emitted only with verbose=True: on large
+    source databases the per-service prints (and their f-string
+    formatting) cost more than the inserts when output is redirected to
+    a synced log file. Per-table summaries always print.
+    """
+
     # Connect to SQLite
     sqlite_conn = sqlite3.connect(sqlite_path)
     sqlite_conn.row_factory = sqlite3.Row
@@ -32,23 +40,33 @@ def migrate_data(sqlite_path: str, postgres_url: str):
     print(f"Connected to PostgreSQL")
     
     try:
+        # Stream SQLite rows in batches: peak memory stays O(batch) instead
+        # of O(table) however large the source database is
+        sqlite_cursor.arraysize = 1000
+
+        def batches(query):
+            sqlite_cursor.execute(query)
+            while batch := sqlite_cursor.fetchmany(1000):
+                yield batch
+
         # Migrate services
         print("\n--- Migrating services ---")
-        sqlite_cursor.execute("SELECT * FROM services")
-        services = sqlite_cursor.fetchall()
-        
+
+        # One upfront lookup of existing services instead of a SELECT per row
+        pg_cursor.execute("SELECT name, id FROM services")
+        existing_by_name = dict(pg_cursor.fetchall())
+
         service_id_map = {}  # old_id -> new_id
-        
-        for service in services:
-            # Check if service already exists
-            pg_cursor.execute("SELECT id FROM services WHERE name = %s", (service['name'],))
-            existing = pg_cursor.fetchone()
-            
-            if existing:
-                print(f"  Service '{service['name']}' already exists, skipping...")
-                service_id_map[service['id']] = existing[0]
+
+        sqlite_cursor.execute("SELECT * FROM services")
+        for service in sqlite_cursor:
+            existing_id = existing_by_name.get(service['name'])
+            if existing_id is not None:
+                if verbose:
+                    print(f"  Service '{service['name']}' already exists, skipping...")
+                service_id_map[service['id']] = existing_id
                 continue
-            
+
             pg_cursor.execute("""
                 INSERT INTO services (name, url, pricing, platforms, scraped_at, last_updated)
                 VALUES (%s, %s, %s, %s, %s, %s)
@@ -63,92 +81,97 @@ def migrate_data(sqlite_path: str, postgres_url: str):
             ))
             new_id = pg_cursor.fetchone()[0]
             service_id_map[service['id']] = new_id
-            print(f"  Migrated service: {service['name']} (old_id={service['id']} -> new_id={new_id})")
-        
-        # Migrate features
+            if verbose:
+                print(f"  Migrated service: {service['name']} (old_id={service['id']} -> new_id={new_id})")
+
+        # Commit per table: a failure later rolls back only the table in
+        # flight, and committed work is not re-sent on retry
+        pg_conn.commit()
+
+        # Migrate features: one multi-row UPSERT per batch instead of two
+        # round-trips (existence SELECT + INSERT) per row
         print("\n--- Migrating features ---")
-        sqlite_cursor.execute("SELECT * FROM features")
-        features = sqlite_cursor.fetchall()
-        
-        for feature in features:
-            old_service_id = feature['service_id']
-            new_service_id = service_id_map.get(old_service_id)
-            
-            if not new_service_id:
-                print(f"  Warning: No mapping for service_id {old_service_id}, skipping feature")
-                continue
-            
-            # Check if feature already exists
-            pg_cursor.execute(
-                "SELECT id FROM features WHERE service_id = %s AND feature_name = %s",
-                (new_service_id, feature['feature_name'])
-            )
-            if pg_cursor.fetchone():
-                continue
-            
-            pg_cursor.execute("""
+        bit_index = {name: i for i, name in enumerate(FEATURE_ORDER)}
+        bits_by_service = {}
+        migrated = skipped = 0
+        for batch in batches("SELECT service_id, feature_name, is_available FROM features"):
+            feature_rows = [(service_id_map[f['service_id']], f['feature_name'], bool(f['is_available']))
+                            for f in batch if f['service_id'] in service_id_map]
+            skipped += len(batch) - len(feature_rows)
+            migrated += len(feature_rows)
+            for new_id, feature_name, is_available in feature_rows:
+                if is_available and feature_name in bit_index:
+                    bits_by_service[new_id] = bits_by_service.get(new_id, 0) | (1 << bit_index[feature_name])
+            execute_values(pg_cursor, """
                 INSERT INTO features (service_id, feature_name, is_available)
-                VALUES (%s, %s, %s)
+                VALUES %s
                 ON CONFLICT (service_id, feature_name) DO UPDATE SET is_available = EXCLUDED.is_available
-            """, (new_service_id, feature['feature_name'], bool(feature['is_available'])))
-        
-        print(f"  Migrated {len(features)} features")
-        
+            """, feature_rows, page_size=500)
+
+        if skipped:
+            print(f"  Warning: skipped {skipped} features with no service mapping")
+        print(f"  Migrated {migrated} features")
+
+        # Services were inserted with the column default of 0, and the
+        # one-time backfill in init_database never fires on a database
+        # whose schema was born with feature_bits — so pack the bits the
+        # ranking path scores from out of the rows just migrated
+        if bits_by_service:
+            execute_values(pg_cursor, """
+                UPDATE services SET feature_bits = v.bits
+                FROM (VALUES %s) AS v(id, bits)
+                WHERE services.id = v.id
+            """, list(bits_by_service.items()), page_size=500)
+        print(f"  Backfilled feature bits for {len(bits_by_service)} services")
+        pg_conn.commit()
+
         # Migrate additional_features
         print("\n--- Migrating additional features ---")
-        sqlite_cursor.execute("SELECT * FROM additional_features")
-        additional = sqlite_cursor.fetchall()
-        
-        for af in additional:
-            old_service_id = af['service_id']
-            new_service_id = service_id_map.get(old_service_id)
-            
-            if not new_service_id:
-                continue
-            
-            pg_cursor.execute("""
+        migrated = 0
+        for batch in batches("SELECT service_id, feature_name FROM additional_features"):
+            additional_rows = [(service_id_map[af['service_id']], af['feature_name'])
+                               for af in batch if af['service_id'] in service_id_map]
+            migrated += len(additional_rows)
+            execute_values(pg_cursor, """
                 INSERT INTO additional_features (service_id, feature_name)
-                VALUES (%s, %s)
-            """, (new_service_id, af['feature_name']))
-        
-        print(f"  Migrated {len(additional)} additional features")
-        
+                VALUES %s
+                ON CONFLICT (service_id, feature_name) DO NOTHING
+            """, additional_rows, page_size=500)
+
+        print(f"  Migrated {migrated} additional features")
+        pg_conn.commit()
+
         # Migrate feature_weights
         print("\n--- Migrating feature weights ---")
-        sqlite_cursor.execute("SELECT * FROM feature_weights")
-        weights = sqlite_cursor.fetchall()
-        
-        for weight in weights:
-            pg_cursor.execute("""
+        migrated = 0
+        for batch in batches("SELECT context, feature_name, weight, created_at FROM feature_weights"):
+            weight_rows = [tuple(w) for w in batch]
+            migrated += len(weight_rows)
+            execute_values(pg_cursor, """
                 INSERT INTO feature_weights (context, feature_name, weight, created_at)
-                VALUES (%s, %s, %s, %s)
+                VALUES %s
                 ON CONFLICT (context, feature_name) DO UPDATE SET weight = EXCLUDED.weight
-            """, (weight['context'], weight['feature_name'], weight['weight'], weight['created_at']))
-        
-        print(f"  Migrated {len(weights)} feature weights")
-        
+            """, weight_rows, page_size=500)
+
+        print(f"  Migrated {migrated} feature weights")
+        pg_conn.commit()
+
         # Migrate rankings
         print("\n--- Migrating rankings ---")
-        sqlite_cursor.execute("SELECT * FROM rankings")
-        rankings = sqlite_cursor.fetchall()
-        
-        for ranking in rankings:
-            old_service_id = ranking['service_id']
-            new_service_id = service_id_map.get(old_service_id)
-            
-            if not new_service_id:
-                continue
-            
-            pg_cursor.execute("""
+        migrated = 0
+        for batch in batches("SELECT context, service_id, rank, score, calculated_at FROM rankings"):
+            ranking_rows = [(r['context'], service_id_map[r['service_id']], r['rank'], r['score'], r['calculated_at'])
+                            for r in batch if r['service_id'] in service_id_map]
+            migrated += len(ranking_rows)
+            execute_values(pg_cursor, """
                 INSERT INTO rankings (context, service_id, rank, score, calculated_at)
-                VALUES (%s, %s, %s, %s, %s)
+                VALUES %s
                 ON CONFLICT (context, service_id) DO UPDATE SET rank = EXCLUDED.rank, score = EXCLUDED.score
-            """, (ranking['context'], new_service_id, ranking['rank'], ranking['score'], ranking['calculated_at']))
-        
-        print(f"  Migrated {len(rankings)} rankings")
-        
-        # Commit all changes
+            """, ranking_rows, page_size=500)
+
+        print(f"  Migrated {migrated} rankings")
         pg_conn.commit()
+        
         print("\n✅ Migration completed successfully!")
         
         # Verify
@@ -157,6 +180,8 @@ def migrate_data(sqlite_path: str, postgres_url: str):
         print(f"   PostgreSQL now has {count} services")
         
     except Exception as e:
+        # Only the table currently in flight is rolled back; earlier
+        # tables were committed as they finished
         pg_conn.rollback()
         print(f"\n❌ Migration failed: {e}")
         raise
@@ -166,18 +191,25 @@ def migrate_data(sqlite_path: str, postgres_url: str):
 
 
 if __name__ == "__main__":
+    import argparse
     import sys
-    
-    sqlite_path = "todo_services.db"
+
+    parser = argparse.ArgumentParser(description="Migrate SQLite data to PostgreSQL")
+    parser.add_argument('--sqlite-path', default="todo_services.db",
+                        help='Path to the source SQLite database')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Print per-row migration progress')
+    args = parser.parse_args()
+
     postgres_url = os.environ.get("DATABASE_URL")
-    
+
     if not postgres_url:
         print("Error: DATABASE_URL environment variable not set")
         print("Usage: DATABASE_URL='postgresql://...' python migrate_to_postgres.py")
         sys.exit(1)
-    
-    if not os.path.exists(sqlite_path):
-        print(f"Error: SQLite database not found at {sqlite_path}")
+
+    if not os.path.exists(args.sqlite_path):
+        print(f"Error: SQLite database not found at {args.sqlite_path}")
         sys.exit(1)
-    
-    migrate_data(sqlite_path, postgres_url)
+
+    migrate_data(args.sqlite_path, postgres_url, verbose=args.verbose)
@@ -2,46 +2,123 @@
 Ranking and comparison system for todo services.
 Analyzes features and provides rankings based on different use cases.
 """
+import sys
+import time
+from datetime import datetime, timezone
 from typing import List, Dict, Optional
-from database import DatabaseManager, DEFAULT_WEIGHTS
+from database import DatabaseManager, DEFAULT_WEIGHTS, FEATURE_ORDER
 import json
 
+# Conditional orjson import: C-level indent/serialization for the report
+# export, stdlib json fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+if ORJSON_AVAILABLE:
+    def _dump_report(obj) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2)
+else:
+    def _dump_report(obj) -> bytes:
+        return json.dumps(obj, indent=2, default=str).encode('utf-8')
+
+# Display labels for the core features, allocated once at import; the
+# display order is the canonical FEATURE_ORDER from the database layer
+FEATURE_LABELS = {
+    'free_tier': 'Free Tier',
+    'collaboration': 'Collaboration',
+    'reminders': 'Reminders',
+    'due_dates': 'Due Dates',
+    'tags_labels': 'Tags/Labels',
+    'subtasks': 'Subtasks',
+    'attachments': 'Attachments',
+    'offline_mode': 'Offline Mode',
+    'calendar_view': 'Calendar View',
+    'integrations': 'Integrations',
+    'api_available': 'API'
+}
+
+# (feature, label) pairs in display order, resolved once
+_DISPLAY_ROWS = [(f, FEATURE_LABELS[f]) for f in FEATURE_ORDER if f in FEATURE_LABELS]
+
 
 class RankingSystem:
     """Analyzes and ranks todo services based on different contexts"""
 
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: DatabaseManager, memo_ttl: Optional[float] = None):
         self.db = db_manager
+        # Memoized reads: a CLI invocation asks for the same comparison
+        # matrix and context rankings several times (display, recommend,
+        # export). memo_ttl=None memoizes for the instance's lifetime,
+        # which is right for a short-lived CLI run; long-lived processes
+        # (the API server) pass a TTL in seconds so entries expire even
+        # though nothing in their process ever calls invalidate().
+        self.memo_ttl = memo_ttl
+        self._comparison_cache = {}
+        self._rankings_cache = {}
+
+    def invalidate(self):
+        """Drop memoized reads (call after recalculating rankings)"""
+        self._comparison_cache.clear()
+        self._rankings_cache.clear()
+
+    def _memo(self, cache: Dict, key, loader):
+        entry = cache.get(key)
+        if entry is not None and (self.memo_ttl is None
+                                  or time.monotonic() - entry[1] < self.memo_ttl):
+            return entry[0]
+        value = loader()
+        cache[key] = (value, time.monotonic())
+        return value
+
+    def _comparison(self, category_slug: str = None) -> Dict:
+        return self._memo(self._comparison_cache, category_slug,
+                          lambda: self.db.get_feature_comparison(category_slug=category_slug))
+
+    def _rankings(self, context: str) -> List[Dict]:
+        return self._memo(self._rankings_cache, context,
+                          lambda: self.db.get_rankings(context))
 
     def generate_all_rankings(self):
         """Generate rankings for all predefined contexts"""
         print("Generating rankings for all contexts...")
 
-        for context, weights in DEFAULT_WEIGHTS.items():
-            print(f"  Calculating rankings for: {context}")
-            rankings = self.db.calculate_rankings(context, weights)
-            print(f"    Top service: {rankings[0]['service_name']} (score: {rankings[0]['score']:.1f})")
+        self.invalidate()
+        # One feature-bits snapshot scored across every context, persisted
+        # in one batch, instead of a full fetch+write cycle per context
+        all_rankings = self.db.calculate_rankings_bulk(DEFAULT_WEIGHTS)
+        for context, rankings in all_rankings.items():
+            # calculate_rankings_bulk already returns the fresh rankings;
+            # seed the memo so the displays that follow don't refetch them
+            self._rankings_cache[context] = (rankings, time.monotonic())
+            print(f"  {context}: top service {rankings[0]['service_name']} (score: {rankings[0]['score']:.1f})")
 
         print("\n✓ All rankings generated successfully!")
 
     def display_rankings(self, context: str, top_n: int = 10):
         """Display rankings for a specific context"""
-        rankings = self.db.get_rankings(context)
+        rankings = self._rankings(context)
 
         if not rankings:
             print(f"No rankings found for context: {context}")
             return
 
-        print(f"\n{'='*60}")
-        print(f"TOP {top_n} TODO SERVICES FOR: {context.upper().replace('_', ' ')}")
-        print(f"{'='*60}\n")
+        # Accumulate lines and emit once: one write/flush for the whole
+        # block instead of a syscall per line on a slow TTY or pipe
+        out = [f"\n{'='*60}",
+               f"TOP {top_n} TODO SERVICES FOR: {context.upper().replace('_', ' ')}",
+               f"{'='*60}\n"]
 
         for i, item in enumerate(rankings[:top_n], 1):
-            print(f"{i:2d}. {item['service_name']:20s} - Score: {item['score']:.1f}")
+            out.append(f"{i:2d}. {item['service_name']:20s} - Score: {item['score']:.1f}")
+        sys.stdout.write("\n".join(out) + "\n")
 
     def display_feature_comparison(self, services: Optional[List[str]] = None):
         """Display a feature comparison matrix"""
-        comparison = self.db.get_feature_comparison()
+        comparison = self._comparison()
 
         if services:
             comparison = {k: v for k, v in comparison.items() if k in services}
@@ -50,47 +127,20 @@ class RankingSystem:
             print("\nNo services to compare.")
             return
 
-        # Define feature order for display
-        feature_order = [
-            'free_tier', 'collaboration', 'reminders', 'due_dates',
-            'tags_labels', 'subtasks', 'attachments', 'offline_mode',
-            'calendar_view', 'integrations', 'api_available'
-        ]
-
-        feature_labels = {
-            'free_tier': 'Free Tier',
-            'collaboration': 'Collaboration',
-            'reminders': 'Reminders',
-            'due_dates': 'Due Dates',
-            'tags_labels': 'Tags/Labels',
-            'subtasks': 'Subtasks',
-            'attachments': 'Attachments',
-            'offline_mode': 'Offline Mode',
-            'calendar_view': 'Calendar View',
-            'integrations': 'Integrations',
-            'api_available': 'API'
-        }
+        out = [f"\n{'='*80}", "FEATURE COMPARISON MATRIX", f"{'='*80}\n"]
 
-        print(f"\n{'='*80}")
-        print("FEATURE COMPARISON MATRIX")
-        print(f"{'='*80}\n")
-
-        # Print header
-        header = f"{'Feature':<20}"
-        for service in comparison.keys():
-            header += f"{service[:15]:>17}"
-        print(header)
-        print("-" * 80)
-
-        # Print each feature
-        for feature in feature_order:
-            if feature in feature_labels:
-                row = f"{feature_labels[feature]:<20}"
-                for service_name, features in comparison.items():
-                    has_feature = features.get(feature, False)
-                    symbol = "✓" if has_feature else "✗"
-                    row += f"{symbol:>17}"
-                print(row)
+        # Truncate names and snapshot feature maps once, not per row, and
+        # build every line with join instead of quadratic += concatenation
+        columns = list(comparison.values())
+        out.append(f"{'Feature':<20}" + "".join(
+            f"{service[:15]:>17}" for service in comparison))
+        out.append("-" * 80)
+
+        for feature, label in _DISPLAY_ROWS:
+            out.append(f"{label:<20}" + "".join(
+                f"{'✓' if features.get(feature, False) else '✗':>17}"
+                for features in columns))
+        sys.stdout.write("\n".join(out) + "\n")
 
     def get_service_summary(self, service_name: str) -> Optional[Dict]:
         """Get a detailed summary of a service"""
@@ -123,48 +173,38 @@ class RankingSystem:
         additional = summary['additional_features']
         rankings = summary['rankings']
 
-        print(f"\n{'='*60}")
-        print(f"SERVICE SUMMARY: {service['name'].upper()}")
-        print(f"{'='*60}\n")
-
-        print(f"URL: {service['url']}")
-        print(f"Pricing: {service['pricing']}")
-        print(f"Platforms: {service['platforms']}")
-
-        print(f"\nCore Features:")
-        feature_labels = {
-            'free_tier': 'Free Tier',
-            'collaboration': 'Collaboration',
-            'reminders': 'Reminders',
-            'due_dates': 'Due Dates',
-            'tags_labels': 'Tags/Labels',
-            'subtasks': 'Subtasks',
-            'attachments': 'Attachments',
-            'offline_mode': 'Offline Mode',
-            'calendar_view': 'Calendar View',
-            'integrations': 'Integrations',
-            'api_available': 'API'
-        }
+        out = [f"\n{'='*60}",
+               f"SERVICE SUMMARY: {service['name'].upper()}",
+               f"{'='*60}\n",
+               f"URL: {service['url']}",
+               f"Pricing: {service['pricing']}",
+               f"Platforms: {service['platforms']}",
+               "\nCore Features:"]
 
-        for feature, label in feature_labels.items():
+        for feature, label in _DISPLAY_ROWS:
             status = "✓" if features.get(feature, False) else "✗"
-            print(f"  {status} {label}")
+            out.append(f"  {status} {label}")
 
         if additional:
-            print(f"\nAdditional Features:")
+            out.append("\nAdditional Features:")
             for feat in additional[:10]:  # Show first 10
-                print(f"  • {feat}")
+                out.append(f"  • {feat}")
             if len(additional) > 10:
-                print(f"  ... and {len(additional) - 10} more")
+                out.append(f"  ... and {len(additional) - 10} more")
 
         if rankings:
-            print(f"\nRankings by Context:")
+            out.append("\nRankings by Context:")
             for context, data in sorted(rankings.items(), key=lambda x: x[1]['rank']):
-                print(f"  #{data['rank']} - {context.replace('_', ' ')} (score: {data['score']:.1f})")
+                out.append(f"  #{data['rank']} - {context.replace('_', ' ')} (score: {data['score']:.1f})")
+        sys.stdout.write("\n".join(out) + "\n")
 
     def recommend_service(self, requirements: Dict[str, bool], context: str = 'personal_use', category_slug: str = None) -> List[Dict]:
         """Recommend services based on specific requirements and category"""
-        comparison = self.db.get_feature_comparison(category_slug=category_slug)
+        comparison = self._comparison(category_slug)
+
+        # Fetch rankings once and index by name: one DB call and an O(1)
+        # lookup per service instead of a ranking scan inside the loop
+        rank_by_name = {r['service_name']: r for r in self._rankings(context)}
 
         scored_services = []
 
@@ -176,41 +216,40 @@ class RankingSystem:
             )
 
             if meets_requirements:
-                # Get score for context
-                rankings = self.db.get_rankings(context)
-                for ranking in rankings:
-                    if ranking['service_name'] == service_name:
-                        scored_services.append({
-                            'name': service_name,
-                            'score': ranking['score'],
-                            'rank': ranking['rank']
-                        })
-                        break
+                ranking = rank_by_name.get(service_name)
+                if ranking:
+                    scored_services.append({
+                        'name': service_name,
+                        'score': ranking['score'],
+                        'rank': ranking['rank']
+                    })
 
         # Sort by score
         scored_services.sort(key=lambda x: x['score'], reverse=True)
 
         return scored_services
 
-    def export_rankings_report(self, output_file: str = "rankings_report.json"):
-        """Export a comprehensive rankings report"""
+    def export_rankings_report(self, output_file: str = "rankings_report.json",
+                               include_comparison: bool = True):
+        """Export a comprehensive rankings report.
+
+        The feature comparison matrix touches every service and feature
+        row; callers that only need the per-context rankings can pass
+        include_comparison=False to skip it entirely.
+        """
         report = {
-            'generated_at': str(datetime.now()),
+            'generated_at': datetime.now(timezone.utc).isoformat(),
             'contexts': {}
         }
 
         # Get rankings for all contexts
         for context in DEFAULT_WEIGHTS.keys():
-            rankings = self.db.get_rankings(context)
-            report['contexts'][context] = rankings
+            report['contexts'][context] = self._rankings(context)
 
-        # Add feature comparison
-        report['feature_comparison'] = self.db.get_feature_comparison()
+        if include_comparison:
+            report['feature_comparison'] = self._comparison()
 
-        with open(output_file, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        with open(output_file, 'wb') as f:
+            f.write(_dump_report(report))
 
         print(f"\n✓ Rankings report exported to: {output_file}")
-
-
-from datetime import datetime
@@ -0,0 +1,18 @@
+"""
+Lightweight scraper registry: just the service names.
+
+Kept free of scraping imports (requests, bs4, aiohttp) so commands that
+only need to know *which* services exist — like `main.py list` — don't
+pay the cost of importing the full scraping stack. scrapers.py asserts
+its SCRAPERS dict stays in sync with this list.
+"""
+
+SCRAPER_NAMES = (
+    'Todoist',
+    'Trello',
+    'Any.do',
+    'Microsoft To Do',
+    'Notion',
+    'Asana',
+    'ClickUp',
+)
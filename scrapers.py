@@ -1,279 +1,238 @@
 """
-Individual scrapers for popular todo list services.
-Each scraper is tailored to extract features from specific services.
+Scraper configurations for popular todo list services.
+One data-driven Scraper class; each service is described by a ScraperConfig.
 """
-from base_scraper import BaseScraper, ServiceFeatures
-from bs4 import BeautifulSoup
-
-
-class TodoistScraper(BaseScraper):
-    """Scraper for Todoist features"""
-
-    def scrape(self) -> ServiceFeatures:
-        soup = self.fetch_page()
-
-        return ServiceFeatures(
-            name="Todoist",
-            url=self.url,
-            free_tier=True,
-            pricing=self.extract_pricing(soup),
-            platforms=self.extract_platforms(soup),
-            collaboration=self.check_feature_mention(soup, ['share', 'team', 'collabora', 'assign']),
-            reminders=self.check_feature_mention(soup, ['reminder', 'notification']),
-            due_dates=True,
-            tags_labels=self.check_feature_mention(soup, ['tag', 'label']),
-            subtasks=self.check_feature_mention(soup, ['subtask', 'section', 'task']),
-            attachments=self.check_feature_mention(soup, ['attach', 'file', 'upload']),
-            offline_mode=self.check_feature_mention(soup, ['offline', 'work offline']),
-            calendar_view=self.check_feature_mention(soup, ['calendar', 'schedule view']),
-            integrations=self.check_feature_mention(soup, ['integrate', 'zapier', 'google calendar']),
-            api_available=True,
-            additional_features=self.extract_additional_features(soup, [
-                'Karma points', 'Natural language input', 'Templates',
-                'Project templates', 'Productivity trends'
-            ])
-        )
-
-    def extract_additional_features(self, soup: BeautifulSoup, features: list) -> list:
-        found = []
-        text = soup.get_text().lower()
-        for feature in features:
-            if feature.lower() in text or any(word in text for word in feature.lower().split()):
-                found.append(feature)
-        return found
-
-
-class TrelloScraper(BaseScraper):
-    """Scraper for Trello features"""
-
-    def scrape(self) -> ServiceFeatures:
-        soup = self.fetch_page()
-
-        return ServiceFeatures(
-            name="Trello",
-            url=self.url,
-            free_tier=True,
-            pricing=self.extract_pricing(soup),
-            platforms=self.extract_platforms(soup),
-            collaboration=self.check_feature_mention(soup, ['board', 'team', 'member', 'share']),
-            reminders=True,  # Trello has due date notifications
-            due_dates=True,
-            tags_labels=self.check_feature_mention(soup, ['label', 'tag']),
-            subtasks=self.check_feature_mention(soup, ['checklist', 'subtask']),
-            attachments=True,  # Core Trello feature
-            offline_mode=self.check_feature_mention(soup, ['offline']),
-            calendar_view=self.check_feature_mention(soup, ['calendar', 'calendar power-up']),
-            integrations=self.check_feature_mention(soup, ['power-up', 'integrate', 'butler']),
-            api_available=True,
-            additional_features=self.extract_additional_features(soup, [
-                'Kanban boards', 'Power-ups', 'Butler automation',
-                'Custom fields', 'Board templates'
-            ])
-        )
-
-    def extract_additional_features(self, soup: BeautifulSoup, features: list) -> list:
-        found = []
-        text = soup.get_text().lower()
-        for feature in features:
-            if feature.lower() in text or any(word in text for word in feature.lower().split()):
-                found.append(feature)
-        return found
-
-
-class AnyDoScraper(BaseScraper):
-    """Scraper for Any.do features"""
-
-    def scrape(self) -> ServiceFeatures:
-        soup = self.fetch_page()
-
-        return ServiceFeatures(
-            name="Any.do",
-            url=self.url,
-            free_tier=True,
-            pricing=self.extract_pricing(soup),
-            platforms=self.extract_platforms(soup),
-            collaboration=self.check_feature_mention(soup, ['share', 'assign', 'collabora']),
-            reminders=True,
-            due_dates=True,
-            tags_labels=self.check_feature_mention(soup, ['category', 'tag']),
-            subtasks=self.check_feature_mention(soup, ['subtask']),
-            attachments=self.check_feature_mention(soup, ['attach', 'file']),
-            offline_mode=self.check_feature_mention(soup, ['offline']),
-            calendar_view=self.check_feature_mention(soup, ['calendar', 'calendar integration']),
-            integrations=self.check_feature_mention(soup, ['integrate', 'sync', 'google calendar']),
-            api_available=self.check_feature_mention(soup, ['api', 'developer']),
-            additional_features=self.extract_additional_features(soup, [
-                'Voice entry', 'Gesture planning', 'WhatsApp integration',
-                'Smart grocery lists', 'Location-based reminders'
-            ])
-        )
-
-    def extract_additional_features(self, soup: BeautifulSoup, features: list) -> list:
-        found = []
-        text = soup.get_text().lower()
-        for feature in features:
-            if feature.lower() in text or any(word in text for word in feature.lower().split()):
-                found.append(feature)
-        return found
-
-
-class MicrosoftToDoScraper(BaseScraper):
-    """Scraper for Microsoft To Do features"""
-
-    def scrape(self) -> ServiceFeatures:
-        soup = self.fetch_page()
-
-        return ServiceFeatures(
-            name="Microsoft To Do",
-            url=self.url,
-            free_tier=True,
-            pricing="Free",
-            platforms=self.extract_platforms(soup),
-            collaboration=self.check_feature_mention(soup, ['share', 'team', 'group']),
-            reminders=True,
-            due_dates=True,
-            tags_labels=self.check_feature_mention(soup, ['tag', 'category']),
-            subtasks=self.check_feature_mention(soup, ['step', 'subtask']),
-            attachments=self.check_feature_mention(soup, ['attach', 'file']),
-            offline_mode=self.check_feature_mention(soup, ['offline']),
-            calendar_view=self.check_feature_mention(soup, ['calendar', 'outlook calendar']),
-            integrations=self.check_feature_mention(soup, ['outlook', 'office 365', 'teams']),
-            api_available=self.check_feature_mention(soup, ['graph api', 'microsoft graph']),
-            additional_features=self.extract_additional_features(soup, [
-                'My Day feature', 'Outlook integration', 'Office 365 integration',
-                'Smart suggestions', 'Task syncing across devices'
-            ])
-        )
-
-    def extract_additional_features(self, soup: BeautifulSoup, features: list) -> list:
-        found = []
-        text = soup.get_text().lower()
-        for feature in features:
-            if feature.lower() in text or any(word in text for word in feature.lower().split()):
-                found.append(feature)
-        return found
-
-
-class NotionScraper(BaseScraper):
-    """Scraper for Notion tasks/features"""
-
-    def scrape(self) -> ServiceFeatures:
-        soup = self.fetch_page()
-
-        return ServiceFeatures(
-            name="Notion",
-            url=self.url,
-            free_tier=True,
-            pricing=self.extract_pricing(soup),
-            platforms=self.extract_platforms(soup),
-            collaboration=True,  # Core feature
-            reminders=self.check_feature_mention(soup, ['reminder', 'notification']),
-            due_dates=True,
-            tags_labels=self.check_feature_mention(soup, ['tag', 'property', 'database']),
-            subtasks=True,  # Can create nested pages
-            attachments=True,
-            offline_mode=self.check_feature_mention(soup, ['offline']),
-            calendar_view=self.check_feature_mention(soup, ['calendar view', 'database view']),
-            integrations=self.check_feature_mention(soup, ['integrate', 'api', 'connect']),
-            api_available=True,
-            additional_features=self.extract_additional_features(soup, [
-                'Databases', 'Wikis', 'Docs', 'Templates',
-                'Kanban boards', 'Timeline view', 'Gallery view',
-                'AI assistant', 'Web clipper'
-            ])
-        )
-
-    def extract_additional_features(self, soup: BeautifulSoup, features: list) -> list:
-        found = []
-        text = soup.get_text().lower()
-        for feature in features:
-            if feature.lower() in text or any(word in text for word in feature.lower().split()):
-                found.append(feature)
-        return found
-
-
-class AsanaScraper(BaseScraper):
-    """Scraper for Asana features"""
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from base_scraper import BaseScraper, ServiceFeatures, warm_keywords
+from scraper_registry import SCRAPER_NAMES
+
+# The eleven core boolean fields of ServiceFeatures; every config's
+# always_true and feature_keywords together must cover exactly these
+_CORE_FEATURES = frozenset({
+    'free_tier', 'collaboration', 'reminders', 'due_dates', 'tags_labels',
+    'subtasks', 'attachments', 'offline_mode', 'calendar_view',
+    'integrations', 'api_available',
+})
+
+
+@dataclass(frozen=True, slots=True)
+class ScraperConfig:
+    """Everything service-specific about a scrape, as data.
+
+    The seven per-service scraper classes differed only in name, URL,
+    which core features are hardcoded True, which are detected by
+    keyword, and the additional-features vocabulary — so those live here
+    and one Scraper class interprets them.
+    """
+    name: str
+    url: str
+    always_true: frozenset
+    feature_keywords: Dict[str, frozenset]
+    additional: Tuple[str, ...]
+    pricing: Optional[str] = None  # fixed string, or None to extract from the page
+
+    def __post_init__(self):
+        covered = self.always_true | self.feature_keywords.keys()
+        if covered != _CORE_FEATURES:
+            raise ValueError(f"{self.name}: config covers {sorted(covered)}, "
+                             f"expected {sorted(_CORE_FEATURES)}")
+
+
+class Scraper(BaseScraper):
+    """Generic scraper driven by a ScraperConfig"""
+
+    def __init__(self, config: ScraperConfig):
+        super().__init__(config.url, config.name)
+        self.config = config
 
     def scrape(self) -> ServiceFeatures:
         soup = self.fetch_page()
+        cfg = self.config
 
-        return ServiceFeatures(
-            name="Asana",
-            url=self.url,
-            free_tier=True,
-            pricing=self.extract_pricing(soup),
-            platforms=self.extract_platforms(soup),
-            collaboration=True,
-            reminders=True,
-            due_dates=True,
-            tags_labels=self.check_feature_mention(soup, ['tag', 'custom field']),
-            subtasks=self.check_feature_mention(soup, ['subtask']),
-            attachments=True,
-            offline_mode=self.check_feature_mention(soup, ['offline']),
-            calendar_view=self.check_feature_mention(soup, ['calendar', 'timeline']),
-            integrations=self.check_feature_mention(soup, ['integrate', 'app']),
-            api_available=True,
-            additional_features=self.extract_additional_features(soup, [
-                'Timeline view', 'Portfolio management', 'Forms',
-                'Workload management', 'Goal tracking', 'Automations'
-            ])
-        )
-
-    def extract_additional_features(self, soup: BeautifulSoup, features: list) -> list:
-        found = []
-        text = soup.get_text().lower()
-        for feature in features:
-            if feature.lower() in text or any(word in text for word in feature.lower().split()):
-                found.append(feature)
-        return found
-
-
-class ClickUpScraper(BaseScraper):
-    """Scraper for ClickUp features"""
-
-    def scrape(self) -> ServiceFeatures:
-        soup = self.fetch_page()
+        flags = {feature: True for feature in cfg.always_true}
+        for feature, keywords in cfg.feature_keywords.items():
+            flags[feature] = self.check_feature_mention(soup, keywords)
 
         return ServiceFeatures(
-            name="ClickUp",
+            name=cfg.name,
             url=self.url,
-            free_tier=True,
-            pricing=self.extract_pricing(soup),
+            pricing=cfg.pricing if cfg.pricing is not None else self.extract_pricing(soup),
             platforms=self.extract_platforms(soup),
-            collaboration=True,
-            reminders=True,
-            due_dates=True,
-            tags_labels=True,
-            subtasks=True,
-            attachments=True,
-            offline_mode=self.check_feature_mention(soup, ['offline']),
-            calendar_view=self.check_feature_mention(soup, ['calendar', 'calendar view']),
-            integrations=True,
-            api_available=True,
-            additional_features=self.extract_additional_features(soup, [
-                'Multiple views', 'Custom statuses', 'Docs',
-                'Whiteboards', 'Mind maps', 'Automations',
-                'Time tracking', 'Goals'
-            ])
+            additional_features=self.extract_additional_features(soup, cfg.additional),
+            **flags
         )
 
-    def extract_additional_features(self, soup: BeautifulSoup, features: list) -> list:
-        found = []
-        text = soup.get_text().lower()
-        for feature in features:
-            if feature.lower() in text or any(word in text for word in feature.lower().split()):
-                found.append(feature)
-        return found
-
 
-# Registry of all scrapers
-SCRAPERS = {
-    'Todoist': lambda: TodoistScraper('https://todoist.com', 'Todoist'),
-    'Trello': lambda: TrelloScraper('https://trello.com', 'Trello'),
-    'Any.do': lambda: AnyDoScraper('https://any.do', 'Any.do'),
-    'Microsoft To Do': lambda: MicrosoftToDoScraper('https://todo.microsoft.com', 'Microsoft To Do'),
-    'Notion': lambda: NotionScraper('https://notion.so', 'Notion'),
-    'Asana': lambda: AsanaScraper('https://asana.com', 'Asana'),
-    'ClickUp': lambda: ClickUpScraper('https://clickup.com', 'ClickUp'),
-}
+SCRAPER_CONFIGS = (
+    ScraperConfig(
+        name='Todoist',
+        url='https://todoist.com',
+        always_true=frozenset({'free_tier', 'due_dates', 'api_available'}),
+        feature_keywords={
+            'collaboration': frozenset({'share', 'team', 'collabora', 'assign'}),
+            'reminders': frozenset({'reminder', 'notification'}),
+            'tags_labels': frozenset({'tag', 'label'}),
+            'subtasks': frozenset({'subtask', 'section', 'task'}),
+            'attachments': frozenset({'attach', 'file', 'upload'}),
+            'offline_mode': frozenset({'offline', 'work offline'}),
+            'calendar_view': frozenset({'calendar', 'schedule view'}),
+            'integrations': frozenset({'integrate', 'zapier', 'google calendar'}),
+        },
+        additional=(
+            'Karma points', 'Natural language input', 'Templates',
+            'Project templates', 'Productivity trends',
+        ),
+    ),
+    ScraperConfig(
+        name='Trello',
+        url='https://trello.com',
+        # reminders via due date notifications; attachments are core Trello
+        always_true=frozenset({'free_tier', 'reminders', 'due_dates',
+                               'attachments', 'api_available'}),
+        feature_keywords={
+            'collaboration': frozenset({'board', 'team', 'member', 'share'}),
+            'tags_labels': frozenset({'label', 'tag'}),
+            'subtasks': frozenset({'checklist', 'subtask'}),
+            'offline_mode': frozenset({'offline'}),
+            'calendar_view': frozenset({'calendar', 'calendar power-up'}),
+            'integrations': frozenset({'power-up', 'integrate', 'butler'}),
+        },
+        additional=(
+            'Kanban boards', 'Power-ups', 'Butler automation',
+            'Custom fields', 'Board templates',
+        ),
+    ),
+    ScraperConfig(
+        name='Any.do',
+        url='https://any.do',
+        always_true=frozenset({'free_tier', 'reminders', 'due_dates'}),
+        feature_keywords={
+            'collaboration': frozenset({'share', 'assign', 'collabora'}),
+            'tags_labels': frozenset({'category', 'tag'}),
+            'subtasks': frozenset({'subtask'}),
+            'attachments': frozenset({'attach', 'file'}),
+            'offline_mode': frozenset({'offline'}),
+            'calendar_view': frozenset({'calendar', 'calendar integration'}),
+            'integrations': frozenset({'integrate', 'sync', 'google calendar'}),
+            'api_available': frozenset({'api', 'developer'}),
+        },
+        additional=(
+            'Voice entry', 'Gesture planning', 'WhatsApp integration',
+            'Smart grocery lists', 'Location-based reminders',
+        ),
+    ),
+    ScraperConfig(
+        name='Microsoft To Do',
+        url='https://todo.microsoft.com',
+        always_true=frozenset({'free_tier', 'reminders', 'due_dates'}),
+        feature_keywords={
+            'collaboration': frozenset({'share', 'team', 'group'}),
+            'tags_labels': frozenset({'tag', 'category'}),
+            'subtasks': frozenset({'step', 'subtask'}),
+            'attachments': frozenset({'attach', 'file'}),
+            'offline_mode': frozenset({'offline'}),
+            'calendar_view': frozenset({'calendar', 'outlook calendar'}),
+            'integrations': frozenset({'outlook', 'office 365', 'teams'}),
+            'api_available': frozenset({'graph api', 'microsoft graph'}),
+        },
+        additional=(
+            'My Day feature', 'Outlook integration', 'Office 365 integration',
+            'Smart suggestions', 'Task syncing across devices',
+        ),
+        pricing='Free',
+    ),
+    ScraperConfig(
+        name='Notion',
+        url='https://notion.so',
+        # collaboration is core; nested pages cover subtasks
+        always_true=frozenset({'free_tier', 'collaboration', 'due_dates',
+                               'subtasks', 'attachments', 'api_available'}),
+        feature_keywords={
+            'reminders': frozenset({'reminder', 'notification'}),
+            'tags_labels': frozenset({'tag', 'property', 'database'}),
+            'offline_mode': frozenset({'offline'}),
+            'calendar_view': frozenset({'calendar view', 'database view'}),
+            'integrations': frozenset({'integrate', 'api', 'connect'}),
+        },
+        additional=(
+            'Databases', 'Wikis', 'Docs', 'Templates',
+            'Kanban boards', 'Timeline view', 'Gallery view',
+            'AI assistant', 'Web clipper',
+        ),
+    ),
+    ScraperConfig(
+        name='Asana',
+        url='https://asana.com',
+        always_true=frozenset({'free_tier', 'collaboration', 'reminders',
+                               'due_dates', 'attachments', 'api_available'}),
+        feature_keywords={
+            'tags_labels': frozenset({'tag', 'custom field'}),
+            'subtasks': frozenset({'subtask'}),
+            'offline_mode': frozenset({'offline'}),
+            'calendar_view': frozenset({'calendar', 'timeline'}),
+            'integrations': frozenset({'integrate', 'app'}),
+        },
+        additional=(
+            'Timeline view', 'Portfolio management', 'Forms',
+            'Workload management', 'Goal tracking', 'Automations',
+        ),
+    ),
+    ScraperConfig(
+        name='ClickUp',
+        url='https://clickup.com',
+        always_true=frozenset({'free_tier', 'collaboration', 'reminders',
+                               'due_dates', 'tags_labels', 'subtasks',
+                               'attachments', 'integrations', 'api_available'}),
+        feature_keywords={
+            'offline_mode': frozenset({'offline'}),
+            'calendar_view': frozenset({'calendar', 'calendar view'}),
+        },
+        additional=(
+            'Multiple views', 'Custom statuses', 'Docs',
+            'Whiteboards', 'Mind maps', 'Automations',
+            'Time tracking', 'Goals',
+        ),
+    ),
+)
+
+
+# The deduplicated keyword universe across every config — terms like
+# 'share', 'tag' or 'offline' recur in five-plus services but enter the
+# matcher once. Warming the shared scanner here builds its automaton a
+# single time at import instead of rebuilding mid-crawl as each
+# service's keywords first appear.
+ALL_KEYWORDS = frozenset(
+    keyword
+    for cfg in SCRAPER_CONFIGS
+    for keywords in cfg.feature_keywords.values()
+    for keyword in keywords
+) | frozenset(
+    term
+    for cfg in SCRAPER_CONFIGS
+    for feature in cfg.additional
+    for term in (feature.lower(), *feature.lower().split())
+)
+warm_keywords(ALL_KEYWORDS)
+
+# One Scraper instance per service, built on first request: repeated
+# registry lookups reuse the instance (and whatever it has cached)
+# instead of allocating a fresh object per call
+_INSTANCES: Dict[str, Scraper] = {}
+
+
+def _scraper_for(cfg: ScraperConfig) -> Scraper:
+    scraper = _INSTANCES.get(cfg.name)
+    if scraper is None:
+        scraper = _INSTANCES[cfg.name] = Scraper(cfg)
+    return scraper
+
+
+# Registry of all scrapers, keyed by service name as before; each entry is
+# still a zero-argument factory so call sites are unchanged
+SCRAPERS = {cfg.name: (lambda cfg=cfg: _scraper_for(cfg)) for cfg in SCRAPER_CONFIGS}
+
+# The lightweight registry is what `main.py list` reads without importing
+# this module; keep the two in lockstep
+assert tuple(SCRAPERS) == SCRAPER_NAMES, "SCRAPERS out of sync with scraper_registry.SCRAPER_NAMES"
@@ -84,17 +84,20 @@ def seed_categories(db: DatabaseManager):
     print("\n=== Seeding Categories ===\n")
     
     categories = [TODO_CATEGORY, NOTE_TAKING_CATEGORY, PASSWORD_MANAGER_CATEGORY]
-    
-    for cat in categories:
-        category_id = db.add_category(
-            name=cat["name"],
-            slug=cat["slug"],
-            description=cat["description"],
-            feature_schema=cat["feature_schema"],
-            ranking_contexts=cat["ranking_contexts"]
-        )
-        print(f"✅ Added category: {cat['name']} (id={category_id})")
-    
+
+    # One transaction for the whole seed: one commit/fsync instead of
+    # one per category
+    with db.transaction():
+        for cat in categories:
+            category_id = db.add_category(
+                name=cat["name"],
+                slug=cat["slug"],
+                description=cat["description"],
+                feature_schema=cat["feature_schema"],
+                ranking_contexts=cat["ranking_contexts"]
+            )
+            print(f"✅ Added category: {cat['name']} (id={category_id})")
+
     return db.get_categories()
 
 
@@ -112,11 +115,13 @@ def assign_existing_services_to_todo(db: DatabaseManager):
     services = db.get_all_services()
     assigned_count = 0
     
-    for service in services:
-        if not service.get('category_id'):
-            db.assign_service_to_category(service['id'], todo_cat['id'])
-            print(f"  Assigned '{service['name']}' to Todo Apps")
-            assigned_count += 1
+    # All assignments commit together instead of once per service
+    with db.transaction():
+        for service in services:
+            if not service.get('category_id'):
+                db.assign_service_to_category(service['id'], todo_cat['id'])
+                print(f"  Assigned '{service['name']}' to Todo Apps")
+                assigned_count += 1
     
     print(f"\n✅ Assigned {assigned_count} services to Todo Apps category")
 
@@ -0,0 +1,17 @@
+"""
+WSGI entry point for production servers.
+
+Run with:
+    gunicorn -k gevent -w 4 --worker-connections 1000 -b 0.0.0.0:$PORT wsgi:app
+
+The gevent monkey-patch must run before anything else imports socket,
+so it lives here rather than in api_server.py. Each gunicorn worker
+imports this module in its own process, which also gives every worker
+its own DatabaseManager (and SQLite/PostgreSQL connections).
+"""
+from gevent import monkey
+monkey.patch_all()
+
+from api_server import app  # noqa: E402
+
+__all__ = ['app']